@@ -7,10 +7,46 @@ Script to migrate from pipsi to pipx
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shutil import which
 
 
+def run_captured(cmd):
+    ret = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    return ret.returncode, ret.stdout
+
+
+def migrate_package(package):
+    """Uninstall package with pipsi and install it with pipx
+
+    Returns whether it succeeded, and its output to print
+    """
+    returncode, output = run_captured(["pipsi", "uninstall", "--yes", package])
+    if returncode:
+        output += (
+            f"Failed to uninstall {package!r} with pipsi. "
+            "Not attempting to install with pipx.\n"
+        )
+        return False, output
+    output += (
+        f"uninstalled {package!r} with pipsi. Now attempting to install with pipx.\n"
+    )
+
+    returncode, install_output = run_captured(["pipx", "install", package])
+    output += install_output
+    if returncode:
+        output += f"Failed to install {package!r} with pipx.\n"
+        return False, output
+    output += f"Successfully installed {package} with pipx\n"
+    return True, output
+
+
 def main():
     if not which("pipx"):
         sys.exit("pipx must be installed to migrate from pipsi to pipx")
@@ -37,24 +73,13 @@ def main():
         sys.exit(0)
 
     error = False
-    for package in packages:
-        ret = subprocess.run(["pipsi", "uninstall", "--yes", package])
-        if ret.returncode:
-            error = True
-            print(
-                f"Failed to uninstall {package!r} with pipsi. "
-                "Not attempting to install with pipx."
-            )
-        else:
-            print(
-                f"uninstalled {package!r} with pipsi. Now attempting to install with pipx."
-            )
-            ret = subprocess.run(["pipx", "install", package])
-            if ret.returncode:
-                error = True
-                print(f"Failed to install {package!r} with pipx.")
-            else:
-                print(f"Successfully installed {package} with pipx")
+    # Packages are migrated independently, several at a time. Output is
+    #   captured so that each package's output is printed in one piece.
+    print("Migrating...")
+    with ThreadPoolExecutor(max_workers=min(8, len(packages))) as executor:
+        for succeeded, output in executor.map(migrate_package, packages):
+            print(output, end="")
+            error = error or not succeeded
 
     print(f"Done migrating {len(packages)} packages!")
     print(
@@ -1,7 +1,7 @@
 import shutil
 import sys
 from contextlib import contextmanager
-from threading import Event, Thread
+from threading import Event, Thread, current_thread, main_thread
 from typing import Generator, List
 
 from pipx.constants import WINDOWS
@@ -34,7 +34,12 @@ def animate(
     message: str, do_animation: bool, *, delay: float = 0
 ) -> Generator[None, None, None]:
 
-    if not do_animation or not _env_supports_animation():
+    if (
+        not do_animation
+        or not _env_supports_animation()
+        # concurrent animations from worker threads would overwrite each other
+        or current_thread() is not main_thread()
+    ):
         # No animation, just a single print of message
         print(f"{message}...")
         yield
@@ -1,13 +1,15 @@
+import functools
 import logging
+import os
 import shlex
 import shutil
 import sys
-import tempfile
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from shutil import which
-from tempfile import TemporaryDirectory
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 import userpath  # type: ignore
 from packaging.utils import canonicalize_name
@@ -18,7 +20,14 @@ from pipx.constants import WINDOWS
 from pipx.emojis import hazard, stars
 from pipx.package_specifier import parse_specifier_for_install, valid_pypi_name
 from pipx.pipx_metadata_file import PackageInfo
-from pipx.util import PipxError, mkdir, pipx_wrap, rmdir
+from pipx.util import (
+    PipxError,
+    exclusive_file_lock,
+    mkdir,
+    output_lock,
+    pipx_wrap,
+    rmdir,
+)
 from pipx.venv import Venv
 
 logger = logging.getLogger(__name__)
@@ -49,13 +58,31 @@ class VenvProblems:
             )
 
 
+# Symlinks in the local bin dir keyed by the (st_dev, st_ino) of the
+#   directory they point into
+LocalBinSymlinks = Dict[Tuple[int, int], List[Path]]
+
+
+# venvs may be processed concurrently, but checking for, creating and removing
+#   files in the shared bin dir must not interleave (e.g. two packages with the
+#   same app), whether in this pipx process or another one
+_expose_apps_lock = threading.Lock()
+
+
+@contextmanager
+def local_bin_dir_lock() -> Iterator[None]:
+    with _expose_apps_lock, exclusive_file_lock(constants.PIPX_HOME / ".lock"):
+        yield
+
+
 def expose_apps_globally(
     local_bin_dir: Path, app_paths: List[Path], *, force: bool, suffix: str = ""
 ) -> None:
-    if not can_symlink(local_bin_dir):
-        _copy_package_apps(local_bin_dir, app_paths, suffix=suffix)
-    else:
-        _symlink_package_apps(local_bin_dir, app_paths, force=force, suffix=suffix)
+    with local_bin_dir_lock():
+        if not can_symlink(local_bin_dir):
+            _copy_package_apps(local_bin_dir, app_paths, suffix=suffix)
+        else:
+            _symlink_package_apps(local_bin_dir, app_paths, force=force, suffix=suffix)
 
 
 _can_symlink_cache: Dict[Path, bool] = {}
@@ -68,6 +95,8 @@ def can_symlink(local_bin_dir: Path) -> bool:
         return True
 
     if local_bin_dir not in _can_symlink_cache:
+        from tempfile import TemporaryDirectory
+
         with TemporaryDirectory(dir=local_bin_dir) as d:
             p = Path(d)
             target = p / "a"
@@ -98,9 +127,42 @@ def _copy_package_apps(
             shutil.copy(src, dest)
 
 
+def _get_path_executable_finder() -> Callable[[str], Optional[str]]:
+    """Return a function like shutil.which that lists each directory on PATH
+    at most once, however many names are looked up with it"""
+    if WINDOWS:
+        # which also tries the PATHEXT extensions and the current directory
+        return which
+
+    path_dirs = [
+        path_dir
+        for path_dir in os.environ.get("PATH", os.defpath).split(os.pathsep)
+        if path_dir
+    ]
+
+    @functools.lru_cache(maxsize=None)
+    def list_path_dir(path_dir: str) -> FrozenSet[str]:
+        try:
+            return frozenset(os.listdir(path_dir))
+        except OSError:
+            return frozenset()
+
+    def find_executable(name: str) -> Optional[str]:
+        for path_dir in path_dirs:
+            if name not in list_path_dir(path_dir):
+                continue
+            path = os.path.join(path_dir, name)
+            if os.access(path, os.X_OK) and not os.path.isdir(path):
+                return path
+        return None
+
+    return find_executable
+
+
 def _symlink_package_apps(
     local_bin_dir: Path, app_paths: List[Path], *, force: bool, suffix: str = ""
 ) -> None:
+    find_executable_on_path = _get_path_executable_finder()
     for app_path in app_paths:
         app_name = app_path.name
         app_name_suffixed = add_suffix(app_name, suffix)
@@ -141,7 +203,7 @@ def _symlink_package_apps(
             )
             symlink_path.unlink()
 
-        existing_executable_on_path = which(app_name_suffixed)
+        existing_executable_on_path = find_executable_on_path(app_name_suffixed)
         symlink_path.symlink_to(app_path)
 
         if existing_executable_on_path:
@@ -160,16 +222,16 @@ def venv_health_check(
     venv: Venv, package_name: Optional[str] = None
 ) -> Tuple[VenvProblems, str]:
     venv_dir = venv.root
-    python_path = venv.python_path.resolve()
 
     if package_name is None:
         package_name = venv.main_package_name
 
-    if not python_path.is_file():
+    # is_file() follows the symlink, resolving is only needed for the message
+    if not venv.python_path.is_file():
         return (
             VenvProblems(invalid_interpreter=True),
             f"   package {red(bold(venv_dir.name))} has invalid "
-            f"interpreter {str(python_path)}\r{hazard}",
+            f"interpreter {str(venv.python_path.resolve())}\r{hazard}",
         )
     if not venv.package_metadata:
         return (
@@ -198,6 +260,7 @@ def get_venv_summary(
     package_name: Optional[str] = None,
     new_install: bool = False,
     include_injected: bool = False,
+    local_bin_symlinks: Optional[LocalBinSymlinks] = None,
 ) -> Tuple[str, VenvProblems]:
     venv = Venv(venv_dir)
 
@@ -217,6 +280,7 @@ def get_venv_summary(
         venv.bin_path,
         constants.LOCAL_BIN_DIR,
         [add_suffix(app, package_metadata.suffix) for app in apps],
+        local_bin_symlinks=local_bin_symlinks,
     )
     exposed_binary_names = sorted(p.name for p in exposed_app_paths)
     unavailable_binary_names = sorted(
@@ -249,6 +313,7 @@ def get_exposed_app_paths_for_package(
     venv_bin_path: Path,
     local_bin_dir: Path,
     package_binary_names: Optional[List[str]] = None,
+    local_bin_symlinks: Optional[LocalBinSymlinks] = None,
 ) -> Set[Path]:
     # package_binary_names is used only if local_bin_path cannot use symlinks.
     # It is necessary for non-symlink systems to return valid app_paths.
@@ -256,27 +321,72 @@ def get_exposed_app_paths_for_package(
         package_binary_names = []
 
     bin_symlinks = set()
-    for b in local_bin_dir.iterdir():
-        try:
-            # sometimes symlinks can resolve to a file of a different name
-            # (in the case of ansible for example) so checking the resolved paths
-            # is not a reliable way to determine if the symlink exists.
-            # We always use the stricter check on non-Windows systems. On
-            # Windows, we use a less strict check if we don't have a symlink.
-            is_same_file = False
-            if can_symlink(local_bin_dir) and b.is_symlink():
-                is_same_file = b.resolve().parent.samefile(venv_bin_path)
-            elif not can_symlink(local_bin_dir):
-                is_same_file = b.name in package_binary_names
-
-            if is_same_file:
+    if not can_symlink(local_bin_dir):
+        # On Windows, we use a less strict check if we don't have a symlink.
+        for b in local_bin_dir.iterdir():
+            if b.name in package_binary_names:
                 bin_symlinks.add(b)
-
-        except FileNotFoundError:
-            pass
+        return bin_symlinks
+
+    # sometimes symlinks can resolve to a file of a different name
+    # (in the case of ansible for example) so checking the resolved paths
+    # is not a reliable way to determine if the symlink exists.
+    # We always use the stricter check on non-Windows systems.
+    try:
+        venv_bin_stat = venv_bin_path.stat()
+    except FileNotFoundError:
+        return bin_symlinks
+    if local_bin_symlinks is None:
+        local_bin_symlinks = get_local_bin_symlinks(local_bin_dir)
+    bin_symlinks.update(
+        local_bin_symlinks.get((venv_bin_stat.st_dev, venv_bin_stat.st_ino), [])
+    )
     return bin_symlinks
 
 
+def get_local_bin_symlinks(local_bin_dir: Path) -> LocalBinSymlinks:
+    """Symlinks in local_bin_dir grouped by the directory they point into
+
+    Directories are keyed by (st_dev, st_ino) so that a venv bin dir can be
+    matched like os.path.samestat. Building this once lets callers that check
+    many venvs read each symlink only once.
+    """
+    local_bin_symlinks: LocalBinSymlinks = {}
+    # most symlinks point into a handful of venv bin dirs, stat each one once
+    target_dir_keys: Dict[str, Tuple[int, int]] = {}
+    with os.scandir(local_bin_dir) as entries:
+        for entry in entries:
+            if not entry.is_symlink():
+                continue
+            try:
+                target_dir = _get_symlink_target_dir(entry.path)
+                if target_dir not in target_dir_keys:
+                    target_dir_stat = os.stat(target_dir)
+                    target_dir_keys[target_dir] = (
+                        target_dir_stat.st_dev,
+                        target_dir_stat.st_ino,
+                    )
+            except FileNotFoundError:
+                continue
+            local_bin_symlinks.setdefault(target_dir_keys[target_dir], []).append(
+                Path(entry.path)
+            )
+    return local_bin_symlinks
+
+
+def _get_symlink_target_dir(symlink_path: str) -> str:
+    """Directory of the file a symlink finally points to
+
+    Equivalent to Path(symlink_path).resolve().parent for comparing with
+    samefile/samestat, but only the symlink itself is read in the common case
+    where it points directly at a regular file.
+    """
+    target = os.path.join(os.path.dirname(symlink_path), os.readlink(symlink_path))
+    if os.path.islink(target):
+        target = os.path.realpath(target)
+    return os.path.dirname(target)
+
+
 def _get_list_output(
     python_version: str,
     package_version: str,
@@ -327,6 +437,8 @@ def package_name_from_spec(
     # check syntax and clean up spec and pip_args
     (package_spec, pip_args) = parse_specifier_for_install(package_spec, pip_args)
 
+    import tempfile
+
     with tempfile.TemporaryDirectory() as temp_venv_dir:
         venv = Venv(Path(temp_venv_dir), python=python, verbose=verbose)
         venv.create_venv(venv_args=[], pip_args=[])
@@ -363,15 +475,16 @@ def run_post_install_actions(
                 """
             )
         if package_metadata.apps_of_dependencies and not include_dependencies:
-            for (
-                dep,
-                dependent_apps,
-            ) in package_metadata.app_paths_of_dependencies.items():
-                print(
-                    f"Note: Dependent package '{dep}' contains {len(dependent_apps)} apps"
-                )
-                for app in dependent_apps:
-                    print(f"  - {app.name}")
+            with output_lock:
+                for (
+                    dep,
+                    dependent_apps,
+                ) in package_metadata.app_paths_of_dependencies.items():
+                    print(
+                        f"Note: Dependent package '{dep}' contains {len(dependent_apps)} apps"
+                    )
+                    for app in dependent_apps:
+                        print(f"  - {app.name}")
             if venv.safe_to_remove():
                 venv.remove_venv()
             raise PipxError(
@@ -400,9 +513,10 @@ def run_post_install_actions(
     package_summary, _ = get_venv_summary(
         venv_dir, package_name=package_name, new_install=True
     )
-    print(package_summary)
-    warn_if_not_on_path(local_bin_dir)
-    print(f"done! {stars}", file=sys.stderr)
+    with output_lock:
+        print(package_summary)
+        warn_if_not_on_path(local_bin_dir)
+        print(f"done! {stars}", file=sys.stderr)
 
 
 def warn_if_not_on_path(local_bin_dir: Path) -> None:
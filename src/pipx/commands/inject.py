@@ -7,7 +7,7 @@ from pipx.colors import bold
 from pipx.commands.common import package_name_from_spec, run_post_install_actions
 from pipx.constants import EXIT_CODE_INJECT_ERROR, EXIT_CODE_OK, ExitCode
 from pipx.emojis import stars
-from pipx.util import PipxError
+from pipx.util import PipxError, is_nonempty_dir
 from pipx.venv import Venv
 
 
@@ -22,7 +22,7 @@ def inject_dep(
     include_dependencies: bool,
     force: bool,
 ) -> bool:
-    if not venv_dir.exists() or not next(venv_dir.iterdir()):
+    if not is_nonempty_dir(venv_dir):
         raise PipxError(
             f"""
             Can't inject {package_spec!r} into nonexistent Virtual Environment
@@ -4,7 +4,7 @@ from typing import List, Optional
 from pipx import constants
 from pipx.commands.common import package_name_from_spec, run_post_install_actions
 from pipx.constants import EXIT_CODE_INSTALL_VENV_EXISTS, EXIT_CODE_OK, ExitCode
-from pipx.util import pipx_wrap
+from pipx.util import is_nonempty_dir, pipx_wrap
 from pipx.venv import Venv, VenvContainer
 
 
@@ -34,10 +34,7 @@ def install(
         venv_container = VenvContainer(constants.PIPX_LOCAL_VENVS)
         venv_dir = venv_container.get_venv_dir(f"{package_name}{suffix}")
 
-    try:
-        exists = venv_dir.exists() and next(venv_dir.iterdir())
-    except StopIteration:
-        exists = False
+    exists = is_nonempty_dir(venv_dir)
 
     venv = Venv(venv_dir, python=python, verbose=verbose)
     if exists:
@@ -6,10 +6,17 @@ from typing import Any, Collection, Dict, Tuple
 
 from pipx import constants
 from pipx.colors import bold
-from pipx.commands.common import VenvProblems, get_venv_summary, venv_health_check
+from pipx.commands.common import (
+    VenvProblems,
+    can_symlink,
+    get_local_bin_symlinks,
+    get_venv_summary,
+    venv_health_check,
+)
 from pipx.constants import EXIT_CODE_LIST_PROBLEM, EXIT_CODE_OK, ExitCode
 from pipx.emojis import sleep
 from pipx.pipx_metadata_file import JsonEncoderHandlesPath, PipxMetadata
+from pipx.util import map_concurrently
 from pipx.venv import Venv, VenvContainer
 
 logger = logging.getLogger(__name__)
@@ -34,10 +41,22 @@ def list_text(
     print(f"apps are exposed on your $PATH at {bold(str(constants.LOCAL_BIN_DIR))}")
 
     all_venv_problems = VenvProblems()
-    for venv_dir in venv_dirs:
-        package_summary, venv_problems = get_venv_summary(
-            venv_dir, include_injected=include_injected
-        )
+    # read the symlinks in the local bin dir once rather than once per venv
+    local_bin_symlinks = (
+        get_local_bin_symlinks(constants.LOCAL_BIN_DIR)
+        if can_symlink(constants.LOCAL_BIN_DIR)
+        else None
+    )
+    # summaries are gathered concurrently but printed in venv_dirs order
+    venv_summaries = map_concurrently(
+        lambda venv_dir: get_venv_summary(
+            venv_dir,
+            include_injected=include_injected,
+            local_bin_symlinks=local_bin_symlinks,
+        ),
+        list(venv_dirs),
+    )
+    for package_summary, venv_problems in venv_summaries:
         if venv_problems.any_():
             logger.warning(package_summary)
         else:
@@ -54,10 +73,12 @@ def list_json(venv_dirs: Collection[Path]) -> VenvProblems:
         "venvs": {},
     }
     all_venv_problems = VenvProblems()
-    for venv_dir in venv_dirs:
-        (venv_metadata, venv_problems, warning_str) = get_venv_metadata_summary(
-            venv_dir
-        )
+    venv_metadata_summaries = map_concurrently(
+        get_venv_metadata_summary, list(venv_dirs)
+    )
+    for venv_dir, (venv_metadata, venv_problems, warning_str) in zip(
+        venv_dirs, venv_metadata_summaries
+    ):
         all_venv_problems.or_(venv_problems)
         if venv_problems.any_():
             warning_messages.append(warning_str)
@@ -5,12 +5,13 @@ from typing import List, Sequence
 from packaging.utils import canonicalize_name
 
 import pipx.shared_libs  # import instead of from so mockable in tests
-from pipx.commands.inject import inject_dep
+from pipx.colors import bold
+from pipx.commands.common import run_post_install_actions
 from pipx.commands.install import install
 from pipx.commands.uninstall import uninstall
 from pipx.constants import EXIT_CODE_OK, EXIT_CODE_REINSTALL_VENV_NONEXISTENT, ExitCode
-from pipx.emojis import sleep
-from pipx.util import PipxError
+from pipx.emojis import sleep, stars
+from pipx.util import PipxError, map_concurrently, output_lock
 from pipx.venv import Venv, VenvContainer
 
 
@@ -19,7 +20,8 @@ def reinstall(
 ) -> ExitCode:
     """Returns pipx exit code."""
     if not venv_dir.exists():
-        print(f"Nothing to reinstall for {venv_dir.name} {sleep}")
+        with output_lock:
+            print(f"Nothing to reinstall for {venv_dir.name} {sleep}")
         return EXIT_CODE_REINSTALL_VENV_NONEXISTENT
 
     venv = Venv(venv_dir, verbose=verbose)
@@ -49,27 +51,27 @@ def reinstall(
         suffix=venv.pipx_metadata.main_package.suffix,
     )
 
-    # now install injected packages
-    for (
-        injected_name,
-        injected_package,
-    ) in venv.pipx_metadata.injected_packages.items():
-        if injected_package.package_or_url is None:
-            # This should never happen, but package_or_url is type
-            #   Optional[str] so mypy thinks it could be None
-            raise PipxError(
-                f"Internal Error injecting package {injected_package} into {venv.name}"
-            )
-        inject_dep(
-            venv_dir,
-            injected_name,
-            injected_package.package_or_url,
-            injected_package.pip_args,
-            verbose=verbose,
-            include_apps=injected_package.include_apps,
-            include_dependencies=injected_package.include_dependencies,
-            force=True,
-        )
+    # now install injected packages, in as few pip calls as their pip_args allow
+    injected_packages = venv.pipx_metadata.injected_packages
+    if injected_packages:
+        reinstalled_venv = Venv(venv_dir, verbose=verbose)
+        reinstalled_venv.install_injected_packages(injected_packages)
+        with output_lock:
+            for injected_name, injected_package in injected_packages.items():
+                if injected_package.include_apps:
+                    run_post_install_actions(
+                        reinstalled_venv,
+                        injected_name,
+                        local_bin_dir,
+                        venv_dir,
+                        injected_package.include_dependencies,
+                        force=True,
+                    )
+                print(
+                    f"  injected package {bold(injected_name)} into venv "
+                    f"{bold(reinstalled_venv.name)}"
+                )
+                print(f"done! {stars}", file=sys.stderr)
 
     # Any failure to install will raise PipxError, otherwise success
     return EXIT_CODE_OK
@@ -86,10 +88,7 @@ def reinstall_all(
     """Returns pipx exit code."""
     pipx.shared_libs.shared_libs.upgrade(verbose=verbose)
 
-    failed: List[str] = []
-    for venv_dir in venv_container.iter_venv_dirs():
-        if venv_dir.name in skip:
-            continue
+    def reinstall_succeeded(venv_dir: Path) -> bool:
         try:
             package_exit = reinstall(
                 venv_dir=venv_dir,
@@ -98,11 +97,21 @@ def reinstall_all(
                 verbose=verbose,
             )
         except PipxError as e:
-            print(e, file=sys.stderr)
-            failed.append(venv_dir.name)
-        else:
-            if package_exit != 0:
-                failed.append(venv_dir.name)
+            with output_lock:
+                print(e, file=sys.stderr)
+            return False
+        return package_exit == 0
+
+    venv_dirs = [
+        venv_dir
+        for venv_dir in venv_container.iter_venv_dirs()
+        if venv_dir.name not in skip
+    ]
+    # venvs are independent of each other, reinstall them concurrently
+    succeeded = map_concurrently(reinstall_succeeded, venv_dirs)
+    failed: List[str] = [
+        venv_dir.name for venv_dir, success in zip(venv_dirs, succeeded) if not success
+    ]
     if len(failed) > 0:
         raise PipxError(
             f"The following package(s) failed to reinstall: {', '.join(failed)}"
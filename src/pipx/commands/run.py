@@ -1,12 +1,11 @@
-import datetime
-import hashlib
 import logging
+import os
+import shutil
 import time
 import urllib.parse
-import urllib.request
 from pathlib import Path
 from shutil import which
-from typing import List, NoReturn
+from typing import List, NoReturn, Optional
 
 from pipx import constants
 from pipx.commands.common import package_name_from_spec
@@ -16,6 +15,7 @@ from pipx.util import (
     PipxError,
     exec_app,
     get_pypackage_bin_path,
+    map_concurrently,
     pipx_wrap,
     rmdir,
     run_pypackage_bin,
@@ -26,6 +26,10 @@ logger = logging.getLogger(__name__)
 
 
 VENV_EXPIRED_FILENAME = "pipx_expired_venv"
+TEMP_VENV_EXPIRATION_THRESHOLD_SEC = 60 * 60 * 24 * TEMP_VENV_EXPIRATION_THRESHOLD_DAYS
+# The whole venv cache is checked for expired venvs at most this often
+VENV_CACHE_SWEEP_INTERVAL_SEC = 60 * 60
+VENV_CACHE_SWEPT_FILENAME = "pipx_cache_swept"
 
 
 def run(
@@ -53,8 +57,8 @@ def run(
             )
         logger.info("Detected url. Downloading and executing as a Python file.")
 
-        content = _http_get_request(app)
-        exec_app([str(python), "-c", content])
+        script_path = _download_script(app)
+        exec_app([str(python), str(script_path)])
 
     elif which(app):
         logger.warning(
@@ -168,21 +172,30 @@ def _get_temporary_venv_path(
     virtual environment. (i.e. args passed to app aren't relevant, but args
     passed to venv creation are.)
     """
-    m = hashlib.sha256()
-    m.update(package_or_url.encode())
-    m.update(python.encode())
-    m.update("".join(pip_args).encode())
-    m.update("".join(venv_args).encode())
-    venv_folder_name = m.hexdigest()[0:15]  # 15 chosen arbitrarily
+    import hashlib
+
+    # Not a security boundary, blake2b is faster than sha256 for short input.
+    #   Each argument is NUL-terminated, with an empty argument between pip
+    #   and venv args, so that e.g. pip args ["a", "bc"] and ["ab", "c"] don't
+    #   share a venv. Hashed in one call, the input is only a few hundred bytes.
+    hash_input = b"".join(
+        arg.encode() + b"\0"
+        for arg in [package_or_url, python, *pip_args, "", *venv_args]
+    )
+    venv_folder_name = hashlib.blake2b(hash_input, digest_size=8).hexdigest()
     return Path(constants.PIPX_VENV_CACHEDIR) / venv_folder_name
 
 
-def _is_temporary_venv_expired(venv_dir: Path) -> bool:
-    created_time_sec = venv_dir.stat().st_ctime
-    current_time_sec = time.mktime(datetime.datetime.now().timetuple())
-    age = current_time_sec - created_time_sec
-    expiration_threshold_sec = 60 * 60 * 24 * TEMP_VENV_EXPIRATION_THRESHOLD_DAYS
-    return age > expiration_threshold_sec or (venv_dir / VENV_EXPIRED_FILENAME).exists()
+def _is_temporary_venv_expired(
+    venv_dir: Path, created_time_sec: Optional[float] = None
+) -> bool:
+    if created_time_sec is None:
+        created_time_sec = venv_dir.stat().st_ctime
+    age = time.time() - created_time_sec
+    return (
+        age > TEMP_VENV_EXPIRATION_THRESHOLD_SEC
+        or (venv_dir / VENV_EXPIRED_FILENAME).exists()
+    )
 
 
 def _prepare_venv_cache(venv: Venv, bin_path: Path, use_cache: bool) -> None:
@@ -190,21 +203,76 @@ def _prepare_venv_cache(venv: Venv, bin_path: Path, use_cache: bool) -> None:
     if not use_cache and bin_path.exists():
         logger.info(f"Removing cached venv {str(venv_dir)}")
         rmdir(venv_dir)
+    elif venv_dir.exists() and _is_temporary_venv_expired(venv_dir):
+        # The sweep below may be skipped, but an expired venv must not be reused
+        logger.info(f"Removing expired venv {str(venv_dir)}")
+        rmdir(venv_dir)
     _remove_all_expired_venvs()
 
 
 def _remove_all_expired_venvs() -> None:
-    for venv_dir in Path(constants.PIPX_VENV_CACHEDIR).iterdir():
-        if _is_temporary_venv_expired(venv_dir):
-            logger.info(f"Removing expired venv {str(venv_dir)}")
-            rmdir(venv_dir)
+    venv_cache_dir = Path(constants.PIPX_VENV_CACHEDIR)
+    swept_path = venv_cache_dir / VENV_CACHE_SWEPT_FILENAME
+    try:
+        if time.time() - swept_path.stat().st_mtime < VENV_CACHE_SWEEP_INTERVAL_SEC:
+            logger.info("Expired venvs were removed recently, not checking again")
+            return
+    except FileNotFoundError:
+        pass
+
+    # DirEntry.stat() needs no extra system call on Windows
+    with os.scandir(venv_cache_dir) as entries:
+        expired_venv_dirs = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name != VENV_CACHE_SWEPT_FILENAME
+            and _is_temporary_venv_expired(Path(entry.path), entry.stat().st_ctime)
+        ]
+    for venv_dir in expired_venv_dirs:
+        logger.info(f"Removing expired venv {str(venv_dir)}")
+    map_concurrently(rmdir, expired_venv_dirs)
+    swept_path.touch()
 
 
-def _http_get_request(url: str) -> str:
+def _download_script(url: str) -> Path:
+    """Stream a script from the internet into a file in the venv cache
+
+    Running it from a file rather than with `python -c` means its size is not
+    limited by the maximum command line length. The file persists until the
+    venv cache sweep removes its directory, like an expired temporary venv,
+    TEMP_VENV_EXPIRATION_THRESHOLD_DAYS after the last download.
+    """
+    # only needed here, importing them (and http.client) costs every pipx startup
+    import hashlib
+    import tempfile
+    import urllib.request
+
+    script_dir = Path(constants.PIPX_VENV_CACHEDIR) / (
+        hashlib.sha256(url.encode()).hexdigest()[0:15]
+    )
+    script_name = Path(urllib.parse.unquote(urllib.parse.urlparse(url).path)).name
+    if script_name in ("", ".", ".."):
+        # e.g. https://host/?script.py, which has no file name to reuse
+        script_name = "script.py"
+    script_path = script_dir / script_name
+    partial_script_path: Optional[Path] = None
     try:
-        res = urllib.request.urlopen(url)
-        charset = res.headers.get_content_charset() or "utf-8"
-        return res.read().decode(charset)
+        script_dir.mkdir(parents=True, exist_ok=True)
+        # Only move the script into place once complete, a concurrent
+        #   `pipx run` of the same URL must never execute a partial file
+        with tempfile.NamedTemporaryFile(
+            dir=script_dir, suffix=".partial", delete=False
+        ) as script_fh:
+            partial_script_path = Path(script_fh.name)
+            with urllib.request.urlopen(url) as res:
+                shutil.copyfileobj(res, script_fh)
+        os.replace(partial_script_path, script_path)
     except Exception as e:
         logger.debug("Uncaught Exception:", exc_info=True)
+        if partial_script_path is not None and partial_script_path.exists():
+            partial_script_path.unlink()
         raise PipxError(str(e))
+    # Moving the script in above updated its directory's ctime, which the
+    #   sweep measures the expiry from
+    _remove_all_expired_venvs()
+    return script_path
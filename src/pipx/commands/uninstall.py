@@ -7,6 +7,7 @@ from pipx.commands.common import (
     add_suffix,
     can_symlink,
     get_exposed_app_paths_for_package,
+    local_bin_dir_lock,
 )
 from pipx.constants import (
     EXIT_CODE_OK,
@@ -16,7 +17,7 @@ from pipx.constants import (
 )
 from pipx.emojis import hazard, sleep, stars
 from pipx.pipx_metadata_file import PackageInfo
-from pipx.util import rmdir
+from pipx.util import map_concurrently, output_lock, rmdir
 from pipx.venv import Venv, VenvContainer
 from pipx.venv_inspect import VenvMetadata
 
@@ -111,28 +112,31 @@ def uninstall(venv_dir: Path, local_bin_dir: Path, verbose: bool) -> ExitCode:
     Returns pipx exit code.
     """
     if not venv_dir.exists():
-        print(f"Nothing to uninstall for {venv_dir.name} {sleep}")
         app = which(venv_dir.name)
-        if app:
-            print(
-                f"{hazard}  Note: '{app}' still exists on your system and is on your PATH"
-            )
+        with output_lock:
+            print(f"Nothing to uninstall for {venv_dir.name} {sleep}")
+            if app:
+                print(
+                    f"{hazard}  Note: '{app}' still exists on your system and is on your PATH"
+                )
         return EXIT_CODE_UNINSTALL_VENV_NONEXISTENT
 
     venv = Venv(venv_dir, verbose=verbose)
 
     bin_dir_app_paths = _get_venv_bin_dir_app_paths(venv, local_bin_dir)
 
-    for bin_dir_app_path in bin_dir_app_paths:
-        try:
-            bin_dir_app_path.unlink()
-        except FileNotFoundError:
-            logger.info(f"tried to remove but couldn't find {bin_dir_app_path}")
-        else:
-            logger.info(f"removed file {bin_dir_app_path}")
+    with local_bin_dir_lock():
+        for bin_dir_app_path in bin_dir_app_paths:
+            try:
+                bin_dir_app_path.unlink()
+            except FileNotFoundError:
+                logger.info(f"tried to remove but couldn't find {bin_dir_app_path}")
+            else:
+                logger.info(f"removed file {bin_dir_app_path}")
 
     rmdir(venv_dir)
-    print(f"uninstalled {venv.name}! {stars}")
+    with output_lock:
+        print(f"uninstalled {venv.name}! {stars}")
     return EXIT_CODE_OK
 
 
@@ -140,9 +144,11 @@ def uninstall_all(
     venv_container: VenvContainer, local_bin_dir: Path, verbose: bool
 ) -> ExitCode:
     """Returns pipx exit code."""
-    all_success = True
-    for venv_dir in venv_container.iter_venv_dirs():
-        return_val = uninstall(venv_dir, local_bin_dir, verbose)
-        all_success &= return_val == 0
+    # venvs are independent of each other, uninstall them concurrently
+    return_vals = map_concurrently(
+        lambda venv_dir: uninstall(venv_dir, local_bin_dir, verbose),
+        list(venv_container.iter_venv_dirs()),
+    )
+    all_success = all(return_val == 0 for return_val in return_vals)
 
     return EXIT_CODE_OK if all_success else EXIT_CODE_UNINSTALL_ERROR
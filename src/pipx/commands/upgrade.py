@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import List, Sequence
+from typing import List, Optional, Sequence
 
 from pipx import constants
 from pipx.colors import bold, red
@@ -8,21 +8,13 @@ from pipx.commands.common import expose_apps_globally
 from pipx.constants import EXIT_CODE_OK, ExitCode
 from pipx.emojis import sleep
 from pipx.package_specifier import parse_specifier_for_upgrade
-from pipx.util import PipxError, pipx_wrap
+from pipx.util import PipxError, map_concurrently, output_lock, pipx_wrap
 from pipx.venv import Venv, VenvContainer
 
 logger = logging.getLogger(__name__)
 
 
-def _upgrade_package(
-    venv: Venv,
-    package_name: str,
-    pip_args: List[str],
-    is_main_package: bool,
-    force: bool,
-    upgrading_all: bool,
-) -> int:
-    """Returns 1 if package version changed, 0 if same version"""
+def _get_package_or_url_for_upgrade(venv: Venv, package_name: str) -> str:
     package_metadata = venv.package_metadata[package_name]
 
     if package_metadata.package_or_url is None:
@@ -30,19 +22,17 @@ def _upgrade_package(
             f"Internal Error: package {package_name} has corrupt pipx metadata."
         )
 
-    package_or_url = parse_specifier_for_upgrade(package_metadata.package_or_url)
-    old_version = package_metadata.package_version
+    return parse_specifier_for_upgrade(package_metadata.package_or_url)
 
-    venv.upgrade_package(
-        package_name,
-        package_or_url,
-        pip_args,
-        include_dependencies=package_metadata.include_dependencies,
-        include_apps=package_metadata.include_apps,
-        is_main_package=is_main_package,
-        suffix=package_metadata.suffix,
-    )
 
+def _finish_package_upgrade(
+    venv: Venv,
+    package_name: str,
+    old_version: str,
+    force: bool,
+    upgrading_all: bool,
+) -> int:
+    """Returns 1 if package version changed, 0 if same version"""
     package_metadata = venv.package_metadata[package_name]
 
     display_name = f"{package_metadata.package}{package_metadata.suffix}"
@@ -118,34 +108,62 @@ def _upgrade_venv(
             wrap_message=False,
         )
 
-    # Upgrade shared libraries (pip, setuptools and wheel)
-    venv.upgrade_packaging_libraries(pip_args)
-
-    versions_updated = 0
-
-    package_name = venv.main_package_name
-    versions_updated += _upgrade_package(
-        venv,
-        package_name,
+    package_names = [venv.main_package_name]
+    if include_injected:
+        package_names += [
+            package_name
+            for package_name in venv.package_metadata
+            if package_name != venv.main_package_name
+        ]
+    package_specs = {
+        package_name: _get_package_or_url_for_upgrade(venv, package_name)
+        for package_name in package_names
+    }
+    old_versions = {
+        package_name: venv.package_metadata[package_name].package_version
+        for package_name in package_names
+    }
+
+    # The main package and any injected packages are upgraded by one pip run,
+    #   shared libraries (pip, setuptools and wheel) are upgraded along with them
+    upgraded_package_names = package_names
+    upgrade_errors: List[PipxError] = []
+    if not venv.upgrade_packages(
+        package_specs,
         pip_args,
-        is_main_package=True,
-        force=force,
-        upgrading_all=upgrading_all,
-    )
+        upgrade_packaging_libraries=True,
+        raise_error=len(package_names) == 1,
+    ):
+        # Upgrade them one at a time instead, so that e.g. an injected package
+        #   that no longer resolves holds back no other package, and its error
+        #   names it
+        upgraded_package_names = []
+        for package_name in package_names:
+            try:
+                venv.upgrade_packages(
+                    {package_name: package_specs[package_name]}, pip_args
+                )
+            except PipxError as e:
+                upgrade_errors.append(e)
+            else:
+                upgraded_package_names.append(package_name)
 
-    if include_injected:
-        for package_name in venv.package_metadata:
-            if package_name == venv.main_package_name:
-                continue
-            versions_updated += _upgrade_package(
+    versions_updated = 0
+    # Keep the lines about this venv's packages together
+    with output_lock:
+        for package_name in upgraded_package_names:
+            versions_updated += _finish_package_upgrade(
                 venv,
                 package_name,
-                pip_args,
-                is_main_package=False,
+                old_versions[package_name],
                 force=force,
                 upgrading_all=upgrading_all,
             )
 
+    if upgrade_errors:
+        raise PipxError(
+            "\n".join(str(error) for error in upgrade_errors), wrap_message=False
+        )
     return versions_updated
 
 
@@ -168,7 +186,7 @@ def upgrade(
         force=force,
     )
 
-    # Any error in upgrade will raise PipxError (e.g. from venv.upgrade_package())
+    # Any error in upgrade will raise PipxError (e.g. from venv.upgrade_packages())
     return EXIT_CODE_OK
 
 
@@ -181,8 +199,7 @@ def upgrade_all(
     force: bool,
 ) -> ExitCode:
     """Returns pipx exit code."""
-    venv_error = False
-    venvs_upgraded = 0
+    venvs_to_upgrade = []
     for venv_dir in venv_container.iter_venv_dirs():
         venv = Venv(venv_dir, verbose=verbose)
         if (
@@ -190,20 +207,29 @@ def upgrade_all(
             or "--editable" in venv.pipx_metadata.main_package.pip_args
         ):
             continue
+        venvs_to_upgrade.append(venv)
+
+    def upgrade_one_venv(venv: Venv) -> Optional[int]:
+        """Returns number of packages with changed versions, None on error"""
         try:
-            venvs_upgraded += _upgrade_venv(
-                venv_dir,
+            return _upgrade_venv(
+                venv.root,
                 venv.pipx_metadata.main_package.pip_args,
                 verbose,
                 include_injected=include_injected,
                 upgrading_all=True,
                 force=force,
             )
-
         except PipxError as e:
-            venv_error = True
-            logger.error(f"Error encountered when upgrading {venv_dir.name}:")
-            logger.error(f"{e}\n")
+            with output_lock:
+                logger.error(f"Error encountered when upgrading {venv.root.name}:")
+                logger.error(f"{e}\n")
+            return None
+
+    # venvs are independent of each other, upgrade them concurrently
+    upgrade_results = map_concurrently(upgrade_one_venv, venvs_to_upgrade)
+    venv_error = None in upgrade_results
+    venvs_upgraded = sum(result for result in upgrade_results if result is not None)
 
     if venvs_upgraded == 0:
         print(
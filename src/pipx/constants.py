@@ -13,6 +13,13 @@ PIPX_SHARED_LIBS = Path(
     os.environ.get("PIPX_SHARED_LIBS", DEFAULT_PIPX_SHARED_LIBS)
 ).resolve()
 PIPX_SHARED_PTH = "pipx_shared.pth"
+PIPX_SHARED_LIBS_CACHE_DIR: Optional[Path] = (
+    Path(os.environ["PIPX_SHARED_LIBS_CACHE_DIR"]).resolve()
+    if os.environ.get("PIPX_SHARED_LIBS_CACHE_DIR")
+    else None
+)
+# Upgrade the shared libraries even if they were upgraded less than a day ago
+PIPX_FORCE_SHARED_LIBS_UPGRADE = bool(os.environ.get("PIPX_FORCE_SHARED_LIBS_UPGRADE"))
 LOCAL_BIN_DIR = Path(os.environ.get("PIPX_BIN_DIR", DEFAULT_PIPX_BIN_DIR)).resolve()
 PIPX_VENV_CACHEDIR = PIPX_HOME / ".cache"
 TEMP_VENV_EXPIRATION_THRESHOLD_DAYS = 14
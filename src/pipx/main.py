@@ -65,6 +65,8 @@ PIPX_DESCRIPTION += pipx_wrap(
       PIPX_BIN_DIR          Overrides location of app installations. Apps are symlinked or copied here.
       USE_EMOJI             Overrides emoji behavior. Default value varies based on platform.
       PIPX_DEFAULT_PYTHON   Overrides default python used for commands.
+      PIPX_SHARED_LIBS_CACHE_DIR  If set, an archive of the shared libraries is kept here and used to restore them instead of recreating them.
+      PIPX_FORCE_SHARED_LIBS_UPGRADE  If set, upgrade the shared libraries even if they were upgraded less than a day ago.
     """,
     subsequent_indent=" " * 24,  # match the indent of argparse options
     keep_newlines=True,
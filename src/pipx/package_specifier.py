@@ -6,34 +6,107 @@
 #   <pypi_package_name><version_specifier>
 #   <local_path>
 
+import copy
+import functools
 import logging
+import os
 import re
 from pathlib import Path
-from typing import List, NamedTuple, Optional, Set, Tuple
+from typing import TYPE_CHECKING, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 
-from packaging.requirements import InvalidRequirement, Requirement
-from packaging.specifiers import SpecifierSet
 from packaging.utils import canonicalize_name
 
+if TYPE_CHECKING:
+    from packaging.requirements import Requirement
+
 from pipx.emojis import hazard
 from pipx.util import PipxError, pipx_wrap
 
 logger = logging.getLogger(__name__)
 
+# The same few names are canonicalized repeatedly while handling one package
+_canonicalize_name = functools.lru_cache(maxsize=1024)(canonicalize_name)
+
+# A PEP508 name with nothing else, the most common spec by far
+_bare_name_pattern = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?\Z")
+# A URL scheme at the start of a spec, e.g. "git+https://"
+_url_scheme_pattern = re.compile(r"\s*[A-Za-z][A-Za-z0-9+.-]*://")
+
 
 class ParsedPackage(NamedTuple):
-    valid_pep508: Optional[Requirement]
+    # shared with the _try_requirement() cache, never modify it
+    valid_pep508: Optional["Requirement"]
     valid_url: Optional[str]
     valid_local_path: Optional[str]
 
 
 def _split_path_extras(package_spec: str) -> Tuple[str, str]:
     """Returns (path, extras_string)"""
-    package_spec_extras_re = re.search(r"(.+)(\[.+\])", package_spec)
-    if package_spec_extras_re:
-        return (package_spec_extras_re.group(1), package_spec_extras_re.group(2))
-    else:
-        return (package_spec, "")
+    # extras can only be a non-empty "[...]" at the end of the spec
+    if package_spec.endswith("]"):
+        extras_start = package_spec.rfind("[")
+        if 0 < extras_start < len(package_spec) - 2:
+            return (package_spec[:extras_start], package_spec[extras_start:])
+    return (package_spec, "")
+
+
+@functools.lru_cache(maxsize=1024)
+def _try_requirement(requirement_str: str) -> Optional["Requirement"]:
+    """Requirement(requirement_str), or None if it is not valid PEP508
+
+    The same spec is parsed several times during a single install, and
+    packaging's parser is slow. The returned Requirement is shared and must
+    not be modified, use _try_requirement_copy() for that.
+    """
+    # packaging.requirements is only needed to parse specs, so keep it off
+    #   pipx's startup path
+    from packaging.requirements import InvalidRequirement, Requirement
+
+    try:
+        return Requirement(requirement_str)
+    except InvalidRequirement:
+        return None
+
+
+def _try_requirement_copy(requirement_str: str) -> Optional["Requirement"]:
+    """Like _try_requirement(), but the Requirement can be modified"""
+    requirement = _try_requirement(requirement_str)
+    return copy.copy(requirement) if requirement is not None else None
+
+
+def _bare_package_name(package_spec: str) -> Optional[str]:
+    """Canonical name if package_spec is just a package name, None otherwise
+
+    Such a spec needs none of the parsing done by _parse_specifier().
+    """
+    if _bare_name_pattern.match(package_spec):
+        return _canonicalize_name(package_spec)
+    return None
+
+
+def _is_path_or_url(package_spec: str) -> bool:
+    """True for specs that cannot be PEP508, so are not worth parsing as such
+
+    PEP508 names start with a letter or digit, which rules out local paths
+    like "./package". A leading "<scheme>://" (e.g. "git+https://...") rules
+    out a name as well, while "name @ https://..." is still left to packaging.
+    """
+    if not package_spec.lstrip()[:1].isalnum():
+        return True
+    return _url_scheme_pattern.match(package_spec) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_existing_path(path_str: str, cwd: str) -> Optional[str]:
+    """Absolute path_str if it exists, None otherwise
+
+    cwd is only part of the cache key, as relative paths depend on it.
+    """
+    path = Path(path_str)
+    try:
+        return str(path.resolve()) if path.exists() else None
+    except OSError:
+        return None
 
 
 def _parse_specifier(package_spec: str) -> ParsedPackage:
@@ -42,43 +115,27 @@ def _parse_specifier(package_spec: str) -> ParsedPackage:
     #       pypi package, not checking for local path.
     #       We replicate pypi precedence here (only non-valid-pypi names
     #       initiate check for local path, e.g. './package-name')
-    valid_pep508 = None
     valid_url = None
     valid_local_path = None
 
-    try:
-        package_req = Requirement(package_spec)
-    except InvalidRequirement:
-        # not a valid PEP508 package specification
-        pass
-    else:
-        # valid PEP508 package specification
-        valid_pep508 = package_req
+    valid_pep508 = None
+    if not _is_path_or_url(package_spec):
+        valid_pep508 = _try_requirement(package_spec)
 
     # packaging currently (2020-07-19) only does basic syntax checks on URL.
     #   Some examples of what it will not catch:
     #       - invalid RCS string (e.g. "gat+https://...")
     #       - non-existent scheme (e.g. "zzzzz://...")
     if not valid_pep508:
-        try:
-            package_req = Requirement("notapackagename @ " + package_spec)
-        except InvalidRequirement:
-            # not a valid url
-            pass
-        else:
+        if _try_requirement("notapackagename @ " + package_spec) is not None:
             valid_url = package_spec
 
     if not valid_pep508 and not valid_url:
         (package_path_str, package_extras_str) = _split_path_extras(package_spec)
 
-        package_path = Path(package_path_str)
-        try:
-            package_path_exists = package_path.exists()
-        except OSError:
-            package_path_exists = False
-
-        if package_path_exists:
-            valid_local_path = str(package_path.resolve()) + package_extras_str
+        resolved_path = _resolve_existing_path(package_path_str, os.getcwd())
+        if resolved_path is not None:
+            valid_local_path = resolved_path + package_extras_str
 
     if not valid_pep508 and not valid_url and not valid_local_path:
         raise PipxError(f"Unable to parse package spec: {package_spec}")
@@ -91,42 +148,96 @@ def _parse_specifier(package_spec: str) -> ParsedPackage:
 
 
 def package_or_url_from_pep508(
-    requirement: Requirement, remove_version_specifiers: bool = False
+    requirement: "Requirement", remove_version_specifiers: bool = False
 ) -> str:
+    from packaging.specifiers import SpecifierSet
+
     requirement.marker = None
-    requirement.name = canonicalize_name(requirement.name)
+    requirement.name = _canonicalize_name(requirement.name)
     if remove_version_specifiers:
         requirement.specifier = SpecifierSet("")
     return str(requirement)
 
 
 def _parsed_package_to_package_or_url(
-    parsed_package: ParsedPackage, remove_version_specifiers: bool
-) -> str:
+    parsed_package: ParsedPackage,
+) -> Tuple[str, str]:
+    """Returns (package_or_url, package_or_url without version specifiers)"""
     if parsed_package.valid_pep508 is not None:
-        if parsed_package.valid_pep508.marker is not None:
-            logger.warning(
-                pipx_wrap(
-                    f"""
-                    {hazard}  Ignoring environment markers
-                    ({parsed_package.valid_pep508.marker}) in package
-                    specification. Use pipx options to specify this type of
-                    information.
-                    """,
-                    subsequent_indent=" " * 4,
-                )
-            )
+        # package_or_url_from_pep508() modifies the requirement
         package_or_url = package_or_url_from_pep508(
-            parsed_package.valid_pep508,
-            remove_version_specifiers=remove_version_specifiers,
+            copy.copy(parsed_package.valid_pep508)
+        )
+        package_or_url_no_version = package_or_url_from_pep508(
+            copy.copy(parsed_package.valid_pep508), remove_version_specifiers=True
         )
     elif parsed_package.valid_url is not None:
-        package_or_url = parsed_package.valid_url
+        package_or_url = package_or_url_no_version = parsed_package.valid_url
     elif parsed_package.valid_local_path is not None:
-        package_or_url = parsed_package.valid_local_path
+        package_or_url = package_or_url_no_version = parsed_package.valid_local_path
 
     logger.info(f"cleaned package spec: {package_or_url}")
-    return package_or_url
+    return (package_or_url, package_or_url_no_version)
+
+
+def _parsed_package_to_extras(parsed_package: ParsedPackage) -> FrozenSet[str]:
+    if parsed_package.valid_pep508 and parsed_package.valid_pep508.extras is not None:
+        return frozenset(parsed_package.valid_pep508.extras)
+    elif parsed_package.valid_local_path:
+        from packaging.requirements import Requirement
+
+        (_, package_extras_str) = _split_path_extras(parsed_package.valid_local_path)
+        return frozenset(Requirement("notapackage" + package_extras_str).extras)
+
+    return frozenset()
+
+
+class _ParsedViews(NamedTuple):
+    package_or_url: str
+    package_or_url_for_upgrade: str
+    extras: FrozenSet[str]
+    is_local_path: bool
+    ignored_marker: Optional[str]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_all(package_spec: str, cwd: str) -> _ParsedViews:
+    """Everything the public functions below derive from package_spec, from a
+    single parse
+
+    cwd is only part of the cache key, as relative paths depend on it.
+    """
+    parsed_package = _parse_specifier(package_spec)
+    (package_or_url, package_or_url_for_upgrade) = _parsed_package_to_package_or_url(
+        parsed_package
+    )
+    marker = parsed_package.valid_pep508 and parsed_package.valid_pep508.marker
+    return _ParsedViews(
+        package_or_url=package_or_url,
+        package_or_url_for_upgrade=package_or_url_for_upgrade,
+        extras=_parsed_package_to_extras(parsed_package),
+        is_local_path=parsed_package.valid_local_path is not None,
+        ignored_marker=str(marker) if marker else None,
+    )
+
+
+def _parse_all_and_warn(package_spec: str) -> _ParsedViews:
+    """_parse_all(), warning about ignored markers on every call, not only the
+    first uncached one"""
+    parsed_views = _parse_all(package_spec, cwd=os.getcwd())
+    if parsed_views.ignored_marker is not None:
+        logger.warning(
+            pipx_wrap(
+                f"""
+                {hazard}  Ignoring environment markers
+                ({parsed_views.ignored_marker}) in package
+                specification. Use pipx options to specify this type of
+                information.
+                """,
+                subsequent_indent=" " * 4,
+            )
+        )
+    return parsed_views
 
 
 def parse_specifier_for_install(
@@ -139,11 +250,8 @@ def parse_specifier_for_install(
     * Ensure --editable is removed for any package_spec not a local path
     * Convert local paths to absolute paths
     """
-    parsed_package = _parse_specifier(package_spec)
-    package_or_url = _parsed_package_to_package_or_url(
-        parsed_package, remove_version_specifiers=False
-    )
-    if "--editable" in pip_args and not parsed_package.valid_local_path:
+    parsed_views = _parse_all_and_warn(package_spec)
+    if "--editable" in pip_args and not parsed_views.is_local_path:
         logger.warning(
             pipx_wrap(
                 f"""
@@ -156,7 +264,7 @@ def parse_specifier_for_install(
         )
         pip_args.remove("--editable")
 
-    return (package_or_url, pip_args)
+    return (parsed_views.package_or_url, pip_args)
 
 
 def parse_specifier_for_metadata(package_spec: str) -> str:
@@ -166,11 +274,10 @@ def parse_specifier_for_metadata(package_spec: str) -> str:
     * Strip any markers (e.g. python_version > 3.4)
     * Convert local paths to absolute paths
     """
-    parsed_package = _parse_specifier(package_spec)
-    package_or_url = _parsed_package_to_package_or_url(
-        parsed_package, remove_version_specifiers=False
-    )
-    return package_or_url
+    package_name = _bare_package_name(package_spec)
+    if package_name is not None:
+        return package_name
+    return _parse_all_and_warn(package_spec).package_or_url
 
 
 def parse_specifier_for_upgrade(package_spec: str) -> str:
@@ -181,28 +288,23 @@ def parse_specifier_for_upgrade(package_spec: str) -> str:
     * Strip any markers (e.g. python_version > 3.4)
     * Convert local paths to absolute paths
     """
-    parsed_package = _parse_specifier(package_spec)
-    package_or_url = _parsed_package_to_package_or_url(
-        parsed_package, remove_version_specifiers=True
-    )
-    return package_or_url
+    package_name = _bare_package_name(package_spec)
+    if package_name is not None:
+        return package_name
+    return _parse_all_and_warn(package_spec).package_or_url_for_upgrade
 
 
 def get_extras(package_spec: str) -> Set[str]:
-    parsed_package = _parse_specifier(package_spec)
-    if parsed_package.valid_pep508 and parsed_package.valid_pep508.extras is not None:
-        return parsed_package.valid_pep508.extras
-    elif parsed_package.valid_local_path:
-        (_, package_extras_str) = _split_path_extras(parsed_package.valid_local_path)
-        return Requirement("notapackage" + package_extras_str).extras
-
-    return set()
+    return set(_parse_all(package_spec, cwd=os.getcwd()).extras)
 
 
 def valid_pypi_name(package_spec: str) -> Optional[str]:
-    try:
-        package_req = Requirement(package_spec)
-    except InvalidRequirement:
+    package_name = _bare_package_name(package_spec)
+    if package_name is not None:
+        return package_name
+
+    package_req = _try_requirement(package_spec)
+    if package_req is None:
         # not a valid PEP508 package specification
         return None
 
@@ -211,17 +313,16 @@ def valid_pypi_name(package_spec: str) -> Optional[str]:
         #   so force package name determination the long way
         return None
 
-    return canonicalize_name(package_req.name)
+    return _canonicalize_name(package_req.name)
 
 
 def fix_package_name(package_or_url: str, package_name: str) -> str:
-    try:
-        package_req = Requirement(package_or_url)
-    except InvalidRequirement:
+    package_req = _try_requirement_copy(package_or_url)
+    if package_req is None:
         # not a valid PEP508 package specification
         return package_or_url
 
-    if canonicalize_name(package_req.name) != canonicalize_name(package_name):
+    if _canonicalize_name(package_req.name) != _canonicalize_name(package_name):
         logger.warning(
             pipx_wrap(
                 f"""
@@ -20,12 +20,22 @@ class JsonEncoderHandlesPath(json.JSONEncoder):
         return super().default(obj)
 
 
+# json.dumps makes a new encoder for every call, metadata is written for every
+#   package installed or upgraded so share one (encode() keeps no state).
+#   Indented because users diff and hand-edit these files.
+_metadata_encoder = JsonEncoderHandlesPath(indent=4, sort_keys=True)
+
+
 def _json_decoder_object_hook(json_dict: Dict[str, Any]) -> Union[Dict[str, Any], Path]:
     if json_dict.get("__type__", None) == "Path" and "__Path__" in json_dict:
         return Path(json_dict["__Path__"])
     return json_dict
 
 
+def _json_decode_path(json_path: Dict[str, str]) -> Path:
+    return Path(json_path["__Path__"])
+
+
 class PackageInfo(NamedTuple):
     package: Optional[str]
     package_or_url: Optional[str]
@@ -101,13 +111,28 @@ class PipxMetadata:
                 """
             )
 
+    @staticmethod
+    def _package_info_from_dict(data: Dict[str, Any]) -> PackageInfo:
+        # Only app paths are encoded Paths, decoding them here is cheaper than
+        #   an object_hook that json.load would call for every object
+        return PackageInfo(
+            **{
+                **data,
+                "app_paths": [_json_decode_path(path) for path in data["app_paths"]],
+                "app_paths_of_dependencies": {
+                    dependency: [_json_decode_path(path) for path in paths]
+                    for (dependency, paths) in data["app_paths_of_dependencies"].items()
+                },
+            }
+        )
+
     def from_dict(self, input_dict: Dict[str, Any]) -> None:
         input_dict = self._convert_legacy_metadata(input_dict)
-        self.main_package = PackageInfo(**input_dict["main_package"])
+        self.main_package = self._package_info_from_dict(input_dict["main_package"])
         self.python_version = input_dict["python_version"]
         self.venv_args = input_dict["venv_args"]
         self.injected_packages = {
-            f"{name}{data.get('suffix', '')}": PackageInfo(**data)
+            f"{name}{data.get('suffix', '')}": self._package_info_from_dict(data)
             for (name, data) in input_dict["injected_packages"].items()
         }
 
@@ -123,14 +148,10 @@ class PipxMetadata:
     def write(self) -> None:
         self._validate_before_write()
         try:
+            # Encode before opening, an encoding error then can't truncate the file
+            metadata_json = _metadata_encoder.encode(self.to_dict())
             with open(self.venv_dir / PIPX_INFO_FILENAME, "w") as pipx_metadata_fh:
-                json.dump(
-                    self.to_dict(),
-                    pipx_metadata_fh,
-                    indent=4,
-                    sort_keys=True,
-                    cls=JsonEncoderHandlesPath,
-                )
+                pipx_metadata_fh.write(metadata_json)
         except IOError:
             logger.warning(
                 pipx_wrap(
@@ -146,10 +167,11 @@ class PipxMetadata:
 
     def read(self, verbose: bool = False) -> None:
         try:
-            with open(self.venv_dir / PIPX_INFO_FILENAME, "r") as pipx_metadata_fh:
-                self.from_dict(
-                    json.load(pipx_metadata_fh, object_hook=_json_decoder_object_hook)
-                )
+            # json.loads detects the encoding of bytes itself, no need to
+            #   decode the file through a text wrapper first
+            self.from_dict(
+                json.loads((self.venv_dir / PIPX_INFO_FILENAME).read_bytes())
+            )
         except IOError:  # Reset self if problem reading
             if verbose:
                 logger.warning(
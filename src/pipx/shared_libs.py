@@ -1,5 +1,8 @@
 import datetime
+import functools
 import logging
+import sys
+import threading
 import time
 from pathlib import Path
 from typing import List, Optional
@@ -9,8 +12,10 @@ from pipx.animate import animate
 from pipx.constants import WINDOWS
 from pipx.interpreter import DEFAULT_PYTHON
 from pipx.util import (
+    exclusive_file_lock,
     get_site_packages,
     get_venv_paths,
+    rmdir,
     run_subprocess,
     subprocess_post_check,
 )
@@ -19,6 +24,20 @@ logger = logging.getLogger(__name__)
 
 
 SHARED_LIBS_MAX_AGE_SEC = datetime.timedelta(days=30).total_seconds()
+# Explicit upgrades (upgrade, reinstall-all) are skipped if the last one was
+#   more recent than this
+SHARED_LIBS_MIN_UPGRADE_INTERVAL_SEC = datetime.timedelta(days=1).total_seconds()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_python_version() -> str:
+    """Full version string (sys.version) of DEFAULT_PYTHON"""
+    if DEFAULT_PYTHON == sys.executable:
+        return sys.version
+    return run_subprocess(
+        [DEFAULT_PYTHON, "-c", "import sys; print(sys.version)"],
+        capture_stderr=False,
+    ).stdout.strip()
 
 
 class _SharedLibs:
@@ -26,11 +45,17 @@ class _SharedLibs:
         self.root = constants.PIPX_SHARED_LIBS
         self.bin_path, self.python_path = get_venv_paths(self.root)
         self.pip_path = self.bin_path / ("pip" if not WINDOWS else "pip.exe")
+        # Next to the venv, as creating it clears the venv directory
+        self.lock_path = self.root.with_name(f"{self.root.name}.lock")
         # i.e. bin_path is ~/.local/pipx/shared/bin
         # i.e. python_path is ~/.local/pipx/shared/python
+        self.cache_dir = constants.PIPX_SHARED_LIBS_CACHE_DIR
         self._site_packages: Optional[Path] = None
         self.has_been_updated_this_run = False
         self.has_been_logged_this_run = False
+        # venvs may be processed concurrently, only one thread may create or
+        #   upgrade the shared libraries at a time
+        self._lock = threading.Lock()
 
     @property
     def site_packages(self) -> Path:
@@ -40,7 +65,15 @@ class _SharedLibs:
         return self._site_packages
 
     def create(self, verbose: bool = False) -> None:
+        # Other pipx processes may be creating or upgrading them too
+        with self._lock, exclusive_file_lock(self.lock_path):
+            self._create(verbose)
+
+    def _create(self, verbose: bool) -> None:
         if not self.is_valid:
+            if self._restore_from_archive(verbose):
+                return
+
             with animate("creating shared libraries", not verbose):
                 create_process = run_subprocess(
                     [DEFAULT_PYTHON, "-m", "venv", "--clear", self.root]
@@ -49,22 +82,99 @@ class _SharedLibs:
 
             # ignore installed packages to ensure no unexpected patches from the OS vendor
             # are used
-            self.upgrade(pip_args=["--force-reinstall"], verbose=verbose)
+            self._upgrade(pip_args=["--force-reinstall"], verbose=verbose, force=True)
+
+    @property
+    def archive_path(self) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        import hashlib
+
+        # The venv has its own location and its base interpreter hard-coded
+        #   into it, so an archive can only be restored for the same pair.
+        #   The interpreter is identified by path and version only, its inode
+        #   or mtime would differ on every fresh CI machine.
+        archive_key = hashlib.sha256(
+            repr(
+                (
+                    str(self.root),
+                    str(Path(DEFAULT_PYTHON).resolve()),
+                    _default_python_version(),
+                    sys.platform,
+                )
+            ).encode("utf-8")
+        ).hexdigest()[:16]
+        return self.cache_dir / f"shared-libs-{archive_key}.tar.gz"
+
+    def _restore_from_archive(self, verbose: bool) -> bool:
+        archive_path = self.archive_path
+        if archive_path is None or not archive_path.is_file():
+            return False
+
+        # imported here, archives are opt-in and rarely used
+        import tarfile
+
+        logger.info(f"Restoring shared libraries from {archive_path}")
+        try:
+            with animate("restoring shared libraries", not verbose):
+                rmdir(self.root)
+                self.root.parent.mkdir(parents=True, exist_ok=True)
+                with tarfile.open(archive_path) as archive:
+                    if hasattr(tarfile, "tar_filter"):
+                        # keep the venv's absolute symlink to its base python
+                        archive.extractall(self.root.parent, filter="tar")
+                    else:
+                        archive.extractall(self.root.parent)
+        except (OSError, tarfile.TarError):
+            logger.warning(
+                f"Failed to restore shared libraries from {archive_path}",
+                exc_info=True,
+            )
+            return False
+        return self.is_valid
+
+    def _save_archive(self) -> None:
+        archive_path = self.archive_path
+        if archive_path is None:
+            return
+
+        import tarfile
+
+        logger.info(f"Saving shared libraries to {archive_path}")
+        partial_archive_path = archive_path.with_name(archive_path.name + ".partial")
+        try:
+            archive_path.parent.mkdir(parents=True, exist_ok=True)
+            with tarfile.open(partial_archive_path, "w:gz") as archive:
+                archive.add(self.root, arcname=self.root.name)
+            partial_archive_path.replace(archive_path)
+        except (OSError, tarfile.TarError):
+            logger.warning(
+                f"Failed to save shared libraries to {archive_path}", exc_info=True
+            )
 
     @property
     def is_valid(self) -> bool:
         return self.python_path.is_file() and self.pip_path.is_file()
 
+    @property
+    def upgraded_recently(self) -> bool:
+        # pip_path is touched after every upgrade, so its mtime records the
+        #   time of the last upgrade across pipx runs
+        try:
+            time_since_last_update_sec = time.time() - self.pip_path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time_since_last_update_sec < SHARED_LIBS_MIN_UPGRADE_INTERVAL_SEC
+
     @property
     def needs_upgrade(self) -> bool:
         if self.has_been_updated_this_run:
             return False
 
-        if not self.pip_path.is_file():
+        try:
+            time_since_last_update_sec = time.time() - self.pip_path.stat().st_mtime
+        except FileNotFoundError:
             return True
-
-        now = time.time()
-        time_since_last_update_sec = now - self.pip_path.stat().st_mtime
         if not self.has_been_logged_this_run:
             logger.info(
                 f"Time since last upgrade of shared libs, in seconds: {time_since_last_update_sec:.0f}. "
@@ -75,9 +185,15 @@ class _SharedLibs:
 
     def upgrade(
         self, *, pip_args: Optional[List[str]] = None, verbose: bool = False
+    ) -> None:
+        with self._lock, exclusive_file_lock(self.lock_path):
+            self._upgrade(pip_args, verbose, force=False)
+
+    def _upgrade(
+        self, pip_args: Optional[List[str]], verbose: bool, force: bool
     ) -> None:
         if not self.is_valid:
-            self.create(verbose=verbose)
+            self._create(verbose)
             return
 
         # Don't try to upgrade multiple times per run
@@ -85,6 +201,14 @@ class _SharedLibs:
             logger.info(f"Already upgraded libraries in {self.root}")
             return
 
+        if (
+            not force
+            and not constants.PIPX_FORCE_SHARED_LIBS_UPGRADE
+            and self.upgraded_recently
+        ):
+            logger.info(f"Libraries in {self.root} were upgraded less than a day ago")
+            return
+
         if pip_args is None:
             pip_args = []
 
@@ -114,6 +238,7 @@ class _SharedLibs:
 
             self.has_been_updated_this_run = True
             self.pip_path.touch()
+            self._save_archive()
 
         except Exception:
             logger.error("Failed to upgrade shared libraries", exc_info=True)
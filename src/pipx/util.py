@@ -1,14 +1,21 @@
+import contextlib
+import functools
 import logging
 import os
 import re
 import shutil
+import stat
 import subprocess
 import sys
 import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterator,
     List,
     NamedTuple,
     NoReturn,
@@ -16,6 +23,7 @@ from typing import (
     Pattern,
     Sequence,
     Tuple,
+    TypeVar,
     Union,
 )
 
@@ -25,6 +33,13 @@ from pipx.constants import WINDOWS
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# venvs may be processed in map_concurrently's threads, hold this while
+#   printing a block of output so blocks of different venvs don't interleave
+output_lock = threading.RLock()
+
 
 class PipxError(Exception):
     def __init__(self, message: str, wrap_message: bool = True):
@@ -42,14 +57,102 @@ class RelevantSearch(NamedTuple):
 def rmdir(path: Path) -> None:
     logger.info(f"removing directory {path}")
     try:
-        if WINDOWS:
-            os.system(f'rmdir /S /Q "{str(path)}"')
-        else:
-            shutil.rmtree(path)
+        _rmtree_concurrently(path)
+    except FileNotFoundError:
+        pass
+
+
+def _rmtree_windows_onerror(func: Callable[[str], Any], path: str, _: Any) -> None:
+    """shutil.rmtree error handler, removing the rest of the tree like
+    `rmdir /S /Q` would
+
+    Windows refuses to delete read-only files, so clear the flag and retry.
+    """
+    try:
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+    except OSError as e:
+        logger.warning(f"Failed to remove {path}: {e}")
+
+
+def _rmtree(path: Union[str, Path]) -> None:
+    if not WINDOWS:
+        shutil.rmtree(path)
+    elif sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_rmtree_windows_onerror)  # type: ignore
+    else:
+        shutil.rmtree(path, onerror=_rmtree_windows_onerror)
+
+
+# Enough subtrees to keep the rmtree thread pool busy
+_RMTREE_MIN_SUBTREES = 16
+_RMTREE_MAX_DEPTH = 6
+
+
+def _child_dirs(path: str) -> List[str]:
+    with os.scandir(path) as entries:
+        return [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+
+
+def _rmtree_subtree(path: str) -> None:
+    try:
+        _rmtree(path)
     except FileNotFoundError:
+        # Removed concurrently, the rest of the tree is still removed below
         pass
 
 
+def _rmtree_concurrently(path: Path) -> None:
+    """shutil.rmtree, with the bulk of the tree removed by a thread pool
+
+    Unlinking releases the GIL. Nearly all files of a venv are a few levels
+    down in site-packages, so directories are expanded breadth-first until
+    there are enough subtrees to share out, which are removed concurrently
+    before the rest of the tree.
+    """
+    if os.path.islink(path):
+        # Never expand the link's target, rmtree refuses symlinks on its own
+        _rmtree(path)
+        return
+
+    subtrees = [str(path)]
+    # Directories that could not be listed (e.g. locked on Windows) are removed
+    #   whole, so rmtree's error handling deals with them as with any entry
+    unlisted_subtrees: List[str] = []
+    for _ in range(_RMTREE_MAX_DEPTH):
+        child_dirs: List[str] = []
+        level_unlisted_subtrees: List[str] = []
+        for subtree in subtrees:
+            try:
+                child_dirs.extend(_child_dirs(subtree))
+            except FileNotFoundError:
+                # Removed concurrently, nothing left to remove there
+                pass
+            except OSError:
+                level_unlisted_subtrees.append(subtree)
+        if not child_dirs:
+            # subtrees still holds this level, including the unlisted ones
+            break
+        subtrees = child_dirs
+        unlisted_subtrees.extend(level_unlisted_subtrees)
+        if len(subtrees) + len(unlisted_subtrees) >= _RMTREE_MIN_SUBTREES:
+            break
+    subtrees.extend(unlisted_subtrees)
+
+    if subtrees != [str(path)]:
+        map_concurrently(_rmtree_subtree, subtrees)
+    _rmtree(path)
+
+
+def is_nonempty_dir(path: Path) -> bool:
+    """True if path is a directory with at least one entry"""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
 def mkdir(path: Path) -> None:
     if path.is_dir():
         return
@@ -57,6 +160,59 @@ def mkdir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def map_concurrently(func: Callable[[T], R], items: Sequence[T]) -> List[R]:
+    """Call func on every item using a thread pool, results in input order
+
+    Meant for per-venv work that mostly waits on subprocesses (pip, the venv
+    python), during which the GIL is released. Threads are used rather than a
+    process pool: workers share the parent's memory instead of forking a copy
+    of it (or re-importing pipx under "spawn"), and logging, the shared libs
+    lock and memoized interpreter info stay shared.
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    max_workers = min(8, (os.cpu_count() or 1) * 2, len(items))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
+
+
+@contextlib.contextmanager
+def exclusive_file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on lock_path, waiting for other pipx processes
+
+    The lock is advisory, so it only keeps out processes taking the same lock,
+    and the OS releases it if pipx dies while holding it. Locks on separate
+    opens of the same file conflict even within one process, so it must not
+    be taken again while held.
+    """
+    mkdir(lock_path.parent)
+    with open(lock_path, "a") as lock_file:
+        if sys.platform == "win32":
+            import msvcrt
+
+            # Lock the first byte, LK_LOCK gives up after 10 seconds
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    logger.info(f"Waiting for lock on {lock_path}")
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 def get_pypackage_bin_path(binary_name: str) -> Path:
     return (
         Path("__pypackages__")
@@ -81,7 +237,6 @@ if WINDOWS:
         python_path = bin_path / "python.exe"
         return bin_path, python_path
 
-
 else:
 
     def get_venv_paths(root: Path) -> Tuple[Path, Path]:
@@ -90,24 +245,51 @@ else:
         return bin_path, python_path
 
 
-def get_site_packages(python: Path) -> Path:
+def interpreter_key(python: Path) -> Tuple[str, int, int, int]:
+    """Identify an interpreter for memoizing what it reports about itself
+
+    The stat of the (symlink-resolved) executable is included so that a venv
+    re-created at the same location with a different python is not confused
+    with the old one.
+    """
+    python_stat = os.stat(python)
+    return (
+        str(python),
+        python_stat.st_dev,
+        python_stat.st_ino,
+        python_stat.st_mtime_ns,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_site_packages(python_key: Tuple[str, int, int, int]) -> Path:
     output = run_subprocess(
-        [python, "-c", "import sysconfig; print(sysconfig.get_path('purelib'))"],
+        [
+            python_key[0],
+            "-c",
+            "import sysconfig; print(sysconfig.get_path('purelib'))",
+        ],
         capture_stderr=False,
     ).stdout
-    path = Path(output.strip())
+    return Path(output.strip())
+
+
+def get_site_packages(python: Path) -> Path:
+    path = _get_site_packages(interpreter_key(python))
     path.mkdir(parents=True, exist_ok=True)
     return path
 
 
+# Remove PYTHONPATH because some platforms (macOS with Homebrew) add pipx
+#   directories to it, and can make it appear to venvs as though pipx
+#   dependencies are in the venv path (#233)
+# Remove __PYVENV_LAUNCHER__ because it can cause the wrong python binary
+#   to be used (#334)
+SUBPROCESS_ENV_BLOCKLIST = ["PYTHONPATH", "__PYVENV_LAUNCHER__"]
+
+
 def _fix_subprocess_env(env: Dict[str, str]) -> Dict[str, str]:
-    # Remove PYTHONPATH because some platforms (macOS with Homebrew) add pipx
-    #   directories to it, and can make it appear to venvs as though pipx
-    #   dependencies are in the venv path (#233)
-    # Remove __PYVENV_LAUNCHER__ because it can cause the wrong python binary
-    #   to be used (#334)
-    env_blocklist = ["PYTHONPATH", "__PYVENV_LAUNCHER__"]
-    for env_to_remove in env_blocklist:
+    for env_to_remove in SUBPROCESS_ENV_BLOCKLIST:
         env.pop(env_to_remove, None)
 
     env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
@@ -118,6 +300,13 @@ def _fix_subprocess_env(env: Dict[str, str]) -> Dict[str, str]:
     return env
 
 
+# Before Python 3.10, subprocess launches children with fork+exec (copying the
+#   parent's page tables) unless it can use posix_spawn, which requires not
+#   asking for fds to be closed. They are non-inheritable anyway (PEP 446).
+#   Python 3.10+ uses vfork by itself, which is faster than posix_spawn.
+_SUBPROCESS_CLOSE_FDS = WINDOWS or sys.version_info >= (3, 10)
+
+
 def run_subprocess(
     cmd: Sequence[Union[str, Path]],
     capture_stdout: bool = True,
@@ -142,6 +331,7 @@ def run_subprocess(
         stderr=subprocess.PIPE if capture_stderr else None,
         encoding="utf-8",
         universal_newlines=True,
+        close_fds=_SUBPROCESS_CLOSE_FDS,
     )
 
     if capture_stdout and log_stdout:
@@ -208,11 +398,13 @@ def analyze_pip_output(pip_stdout: str, pip_stderr: str) -> None:
 
     failed_build_stdout = []
     last_collecting_dep: Optional[str] = None
+    failed_stdout_patt = re.compile(r"Failed to build\s+(\S.+)$")
+    collecting_stdout_patt = re.compile(r"^\s*Collecting\s+(\S+)")
     # for any useful information in stdout, `pip install` must be run without
     #   the -q option
     for line in pip_stdout.split("\n"):
-        failed_match = re.search(r"Failed to build\s+(\S.+)$", line)
-        collecting_match = re.search(r"^\s*Collecting\s+(\S+)", line)
+        failed_match = failed_stdout_patt.search(line)
+        collecting_match = collecting_stdout_patt.search(line)
         if failed_match:
             failed_build_stdout = failed_match.group(1).strip().split()
         if collecting_match:
@@ -1,20 +1,28 @@
-import json
 import logging
+import os
 import re
+import sys
 import time
 from pathlib import Path
 from subprocess import CompletedProcess
-from typing import Dict, Generator, List, NoReturn, Optional, Set
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Generator,
+    List,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+)
 
-try:
-    from importlib.metadata import Distribution, EntryPoint
-except ImportError:
-    from importlib_metadata import Distribution, EntryPoint  # type: ignore
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
 
 from packaging.utils import canonicalize_name
 
 from pipx.animate import animate
-from pipx.constants import PIPX_SHARED_PTH, ExitCode
+from pipx.constants import PIPX_SHARED_PTH
 from pipx.emojis import hazard
 from pipx.interpreter import DEFAULT_PYTHON
 from pipx.package_specifier import (
@@ -26,18 +34,20 @@ from pipx.package_specifier import (
 from pipx.pipx_metadata_file import PackageInfo, PipxMetadata
 from pipx.shared_libs import shared_libs
 from pipx.util import (
+    SUBPROCESS_ENV_BLOCKLIST,
     PipxError,
     exec_app,
     full_package_description,
     get_site_packages,
     get_venv_paths,
+    is_nonempty_dir,
     pipx_wrap,
     rmdir,
     run_subprocess,
     subprocess_post_check,
     subprocess_post_check_handle_pip_error,
 )
-from pipx.venv_inspect import VenvMetadata, inspect_venv
+from pipx.venv_inspect import VenvMetadata, fetch_info_in_venv, inspect_venv
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +61,32 @@ _entry_point_value_pattern = re.compile(
 )
 
 
+def _clean_install_spec(
+    package_name: str, package_or_url: str, pip_args: List[str]
+) -> Tuple[str, List[str]]:
+    # package_name in package specifier can mismatch URL due to user error
+    package_or_url = fix_package_name(package_or_url, package_name)
+
+    # check syntax and clean up spec and pip_args
+    return parse_specifier_for_install(package_or_url, pip_args)
+
+
+def _run_venv_module_in_process(venv_module_args: List[str]) -> None:
+    """Equivalent of `python -m venv ...` for the running interpreter"""
+    import venv as venv_module
+
+    logger.info(f"running venv module in-process: {' '.join(venv_module_args)}")
+    try:
+        venv_module.main(venv_module_args)
+    except SystemExit as e:
+        # argparse already printed what is wrong with the arguments
+        if e.code:
+            raise PipxError(f"Invalid venv arguments: {' '.join(venv_module_args)}")
+    except Exception as e:
+        logger.debug("Uncaught Exception:", exc_info=True)
+        raise PipxError(f"Error creating virtual environment: {e}")
+
+
 class VenvContainer:
     """A collection of venvs managed by pipx."""
 
@@ -67,10 +103,12 @@ class VenvContainer:
         """Iterate venv directories in this container."""
         if not self._root.is_dir():
             return
-        for entry in self._root.iterdir():
-            if not entry.is_dir():
-                continue
-            yield entry
+        # scandir usually knows the entry type without an extra stat per entry
+        with os.scandir(self._root) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                yield Path(entry.path)
 
     def get_venv_dir(self, package_name: str) -> Path:
         """Return the expected venv path for given `package_name`."""
@@ -93,10 +131,10 @@ class Venv:
         self.pipx_metadata = PipxMetadata(venv_dir=path)
         self.verbose = verbose
         self.do_animation = not verbose
-        try:
-            self._existing = self.root.exists() and next(self.root.iterdir())
-        except StopIteration:
-            self._existing = False
+        self._uses_shared_libs: Optional[bool] = None
+        # pipx run looks up an app's entry point both in has_app and run_app
+        self._entry_points: Dict[str, Optional["EntryPoint"]] = {}
+        self._existing = is_nonempty_dir(self.root)
 
         if self._existing and self.uses_shared_libs:
             if shared_libs.is_valid:
@@ -131,12 +169,27 @@ class Venv:
 
     @property
     def uses_shared_libs(self) -> bool:
-        if self._existing:
-            pth_files = self.root.glob("**/" + PIPX_SHARED_PTH)
-            return next(pth_files, None) is not None
-        else:
-            # always use shared libs when creating a new venv
-            return True
+        if self._uses_shared_libs is None:
+            if self._existing:
+                self._uses_shared_libs = self._has_shared_libs_pth()
+            else:
+                # always use shared libs when creating a new venv
+                self._uses_shared_libs = True
+        return self._uses_shared_libs
+
+    def _has_shared_libs_pth(self) -> bool:
+        # Look in the site-packages locations of the standard venv layouts
+        #   before resorting to searching the whole venv
+        site_packages_dirs = list(self.root.glob("lib/*/site-packages")) + list(
+            self.root.glob("Lib/site-packages")
+        )
+        if site_packages_dirs:
+            return any(
+                (site_packages / PIPX_SHARED_PTH).is_file()
+                for site_packages in site_packages_dirs
+            )
+        pth_files = self.root.glob("**/" + PIPX_SHARED_PTH)
+        return next(pth_files, None) is not None
 
     @property
     def package_metadata(self) -> Dict[str, PackageInfo]:
@@ -157,10 +210,22 @@ class Venv:
             return self.pipx_metadata.main_package.package
 
     def create_venv(self, venv_args: List[str], pip_args: List[str]) -> None:
+        venv_module_args = ["--without-pip"] + venv_args + [str(self.root)]
         with animate("creating virtual environment", self.do_animation):
-            cmd = [self.python, "-m", "venv", "--without-pip"]
-            venv_process = run_subprocess(cmd + venv_args + [str(self.root)])
-        subprocess_post_check(venv_process)
+            if self.python == sys.executable and not any(
+                env_var in os.environ for env_var in SUBPROCESS_ENV_BLOCKLIST
+            ):
+                # pipx's own interpreter, no need to start another one, unless
+                #   the environment has variables that only a subprocess gets
+                #   removed (e.g. __PYVENV_LAUNCHER__ on macOS)
+                _run_venv_module_in_process(venv_module_args)
+                venv_process = None
+            else:
+                venv_process = run_subprocess(
+                    [self.python, "-m", "venv"] + venv_module_args
+                )
+        if venv_process is not None:
+            subprocess_post_check(venv_process)
 
         shared_libs.create(self.verbose)
         pipx_pth = get_site_packages(self.python_path) / PIPX_SHARED_PTH
@@ -176,7 +241,6 @@ class Venv:
         pipx_pth.write_text(f"{shared_libs.site_packages}\n", encoding="utf-8")
 
         self.pipx_metadata.venv_args = venv_args
-        self.pipx_metadata.python_version = self.get_python_version()
 
     def safe_to_remove(self) -> bool:
         return not self._existing
@@ -195,14 +259,6 @@ class Venv:
                 )
             )
 
-    def upgrade_packaging_libraries(self, pip_args: List[str]) -> None:
-        if self.uses_shared_libs:
-            shared_libs.upgrade(verbose=self.verbose)
-        else:
-            # TODO: setuptools and wheel? Original code didn't bother
-            # but shared libs code does.
-            self._upgrade_package_no_metadata("pip", pip_args)
-
     def install_package(
         self,
         package_name: str,
@@ -213,45 +269,52 @@ class Venv:
         is_main_package: bool,
         suffix: str = "",
     ) -> None:
-        # package_name in package specifier can mismatch URL due to user error
-        package_or_url = fix_package_name(package_or_url, package_name)
+        (package_or_url, pip_args) = _clean_install_spec(
+            package_name, package_or_url, pip_args
+        )
+        self._pip_install(
+            [package_or_url],
+            pip_args,
+            full_package_description(package_name, package_or_url),
+        )
 
-        # check syntax and clean up spec and pip_args
-        (package_or_url, pip_args) = parse_specifier_for_install(
-            package_or_url, pip_args
+        self._update_package_metadata(
+            package_name=package_name,
+            package_or_url=package_or_url,
+            pip_args=pip_args,
+            include_dependencies=include_dependencies,
+            include_apps=include_apps,
+            is_main_package=is_main_package,
+            suffix=suffix,
         )
+        self._verify_package_installed(package_name, package_or_url)
 
-        with animate(
-            f"installing {full_package_description(package_name, package_or_url)}",
-            self.do_animation,
-        ):
+    def _run_pip_install(
+        self, package_or_urls: List[str], pip_args: List[str], description: str
+    ) -> "CompletedProcess[str]":
+        with animate(f"installing {description}", self.do_animation):
             # do not use -q with `pip install` so subprocess_post_check_pip_errors
             #   has more information to analyze in case of failure.
             cmd = (
                 [str(self.python_path), "-m", "pip", "install"]
                 + pip_args
-                + [package_or_url]
+                + package_or_urls
             )
             # no logging because any errors will be specially logged by
             #   subprocess_post_check_handle_pip_error()
-            pip_process = run_subprocess(cmd, log_stdout=False, log_stderr=False)
+            return run_subprocess(cmd, log_stdout=False, log_stderr=False)
+
+    def _pip_install(
+        self, package_or_urls: List[str], pip_args: List[str], description: str
+    ) -> None:
+        pip_process = self._run_pip_install(package_or_urls, pip_args, description)
         subprocess_post_check_handle_pip_error(pip_process)
         if pip_process.returncode:
-            raise PipxError(
-                f"Error installing {full_package_description(package_name, package_or_url)}."
-            )
+            raise PipxError(f"Error installing {description}.")
 
-        self._update_package_metadata(
-            package_name=package_name,
-            package_or_url=package_or_url,
-            pip_args=pip_args,
-            include_dependencies=include_dependencies,
-            include_apps=include_apps,
-            is_main_package=is_main_package,
-            suffix=suffix,
-        )
-
-        # Verify package installed ok
+    def _verify_package_installed(self, package_name: str, package_or_url: str) -> None:
+        # pip succeeding does not mean package_name was installed, e.g. the spec
+        #   may have resolved to a differently named package
         if self.package_metadata[package_name].package_version is None:
             raise PipxError(
                 f"Unable to install "
@@ -261,6 +324,61 @@ class Venv:
                 wrap_message=False,
             )
 
+    def install_injected_packages(
+        self, injected_packages: Dict[str, PackageInfo]
+    ) -> None:
+        """Install already-named injected packages, e.g. from metadata
+
+        Packages sharing the same pip_args are installed with a single pip call.
+        If that fails, they are installed one at a time to find the culprit.
+        """
+        package_groups: Dict[Tuple[str, ...], List[Tuple[str, str, PackageInfo]]] = {}
+        for package_name, package_info in injected_packages.items():
+            if package_info.package_or_url is None:
+                # This should never happen, but package_or_url is type
+                #   Optional[str] so mypy thinks it could be None
+                raise PipxError(
+                    f"Internal Error injecting package {package_info} into {self.name}"
+                )
+            (package_or_url, pip_args) = _clean_install_spec(
+                package_name, package_info.package_or_url, list(package_info.pip_args)
+            )
+            package_groups.setdefault(tuple(pip_args), []).append(
+                (package_name, package_or_url, package_info)
+            )
+
+        for pip_args_key, package_group in package_groups.items():
+            pip_args = list(pip_args_key)
+            installed_together = False
+            if len(package_group) > 1:
+                installed_together = not self._run_pip_install(
+                    [package_or_url for (_, package_or_url, _) in package_group],
+                    pip_args,
+                    ", ".join(
+                        full_package_description(package_name, package_or_url)
+                        for (package_name, package_or_url, _) in package_group
+                    ),
+                ).returncode
+            if not installed_together:
+                # One at a time, so a pip error names the package that caused it
+                for (package_name, package_or_url, _) in package_group:
+                    self._pip_install(
+                        [package_or_url],
+                        pip_args,
+                        full_package_description(package_name, package_or_url),
+                    )
+
+            for (package_name, package_or_url, package_info) in package_group:
+                self._update_package_metadata(
+                    package_name=package_name,
+                    package_or_url=package_or_url,
+                    pip_args=pip_args,
+                    include_dependencies=package_info.include_dependencies,
+                    include_apps=package_info.include_apps,
+                    is_main_package=False,
+                )
+                self._verify_package_installed(package_name, package_or_url)
+
     def install_package_no_deps(self, package_or_url: str, pip_args: List[str]) -> str:
         with animate(
             f"determining package name from {package_or_url!r}", self.do_animation
@@ -315,6 +433,8 @@ class Venv:
         is_main_package: bool,
         suffix: str = "",
     ) -> None:
+        # the package was just (re)installed, its entry points may have changed
+        self._entry_points.clear()
         venv_package_metadata = self.get_venv_metadata_for_package(
             package_name, get_extras(package_or_url)
         )
@@ -335,22 +455,35 @@ class Venv:
             self.pipx_metadata.main_package = package_info
         else:
             self.pipx_metadata.injected_packages[package_name] = package_info
+        # reported by the same venv python invocation that found the apps
+        self.pipx_metadata.python_version = venv_package_metadata.python_version
 
         self.pipx_metadata.write()
 
-    def get_python_version(self) -> str:
-        return run_subprocess([str(self.python_path), "--version"]).stdout.strip()
-
     def list_installed_packages(self) -> Set[str]:
-        cmd_run = run_subprocess(
-            [str(self.python_path), "-m", "pip", "list", "--format=json"]
-        )
-        pip_list = json.loads(cmd_run.stdout.strip())
-        return set([x["name"] for x in pip_list])
+        # Only sys.path is needed from the venv python; distributions are
+        #   read in-process instead of spawning `pip list`
+        try:
+            from importlib.metadata import distributions
+        except ImportError:
+            from importlib_metadata import distributions  # type: ignore
 
-    def _find_entry_point(self, app: str) -> Optional[EntryPoint]:
+        (venv_sys_path, _, _) = fetch_info_in_venv(self.python_path)
+        return {dist.metadata["name"] for dist in distributions(path=venv_sys_path)}
+
+    def _find_entry_point(self, app: str) -> Optional["EntryPoint"]:
         if not self.python_path.exists():
             return None
+        if app not in self._entry_points:
+            self._entry_points[app] = self._discover_entry_point(app)
+        return self._entry_points[app]
+
+    def _discover_entry_point(self, app: str) -> Optional["EntryPoint"]:
+        try:
+            from importlib.metadata import Distribution
+        except ImportError:
+            from importlib_metadata import Distribution  # type: ignore
+
         dists = Distribution.discover(
             name=self.main_package_name,
             path=[str(get_site_packages(self.python_path))],
@@ -386,46 +519,61 @@ class Venv:
             return True
         return (self.bin_path / filename).is_file()
 
-    def _upgrade_package_no_metadata(
-        self, package_name: str, pip_args: List[str]
-    ) -> None:
-        with animate(
-            f"upgrading {full_package_description(package_name, package_name)}",
-            self.do_animation,
-        ):
-            pip_process = self._run_pip(
-                ["install"] + pip_args + ["--upgrade", package_name]
-            )
-        subprocess_post_check(pip_process)
-
-    def upgrade_package(
+    def upgrade_packages(
         self,
-        package_name: str,
-        package_or_url: str,
+        package_specs: Dict[str, str],
         pip_args: List[str],
-        include_dependencies: bool,
-        include_apps: bool,
-        is_main_package: bool,
-        suffix: str = "",
-    ) -> None:
-        with animate(
-            f"upgrading {full_package_description(package_name, package_or_url)}",
-            self.do_animation,
-        ):
+        upgrade_packaging_libraries: bool = False,
+        raise_error: bool = True,
+    ) -> bool:
+        """Upgrade installed packages, a map of package name to package_or_url
+
+        All packages are upgraded by a single pip call, and their apps and
+        versions are then recorded using their existing pipx metadata.
+
+        Returns False if pip failed and raise_error is False, pip's output is
+        then only logged.
+        """
+        # Venvs without shared libs get pip upgraded in the same pip
+        #   invocation as the package, saving a separate pip startup
+        # TODO: setuptools and wheel? Original code didn't bother
+        #   but shared libs code does.
+        packaging_libraries_args: List[str] = []
+        if upgrade_packaging_libraries:
+            if self.uses_shared_libs:
+                shared_libs.upgrade(verbose=self.verbose)
+            else:
+                packaging_libraries_args = ["--upgrade", "pip"]
+
+        packages_description = ", ".join(
+            full_package_description(package_name, package_or_url)
+            for package_name, package_or_url in package_specs.items()
+        )
+        with animate(f"upgrading {packages_description}", self.do_animation):
             pip_process = self._run_pip(
-                ["install"] + pip_args + ["--upgrade", package_or_url]
+                ["install"]
+                + packaging_libraries_args
+                + pip_args
+                + ["--upgrade"]
+                + list(package_specs.values())
             )
+        if pip_process.returncode and not raise_error:
+            logger.info(f"Failed to upgrade {packages_description}")
+            return False
         subprocess_post_check(pip_process)
 
-        self._update_package_metadata(
-            package_name=package_name,
-            package_or_url=package_or_url,
-            pip_args=pip_args,
-            include_dependencies=include_dependencies,
-            include_apps=include_apps,
-            is_main_package=is_main_package,
-            suffix=suffix,
-        )
+        for package_name, package_or_url in package_specs.items():
+            package_metadata = self.package_metadata[package_name]
+            self._update_package_metadata(
+                package_name=package_name,
+                package_or_url=package_or_url,
+                pip_args=pip_args,
+                include_dependencies=package_metadata.include_dependencies,
+                include_apps=package_metadata.include_apps,
+                is_main_package=package_name == self.main_package_name,
+                suffix=package_metadata.suffix,
+            )
+        return True
 
     def _run_pip(self, cmd: List[str]) -> "CompletedProcess[str]":
         cmd = [str(self.python_path), "-m", "pip"] + cmd
@@ -433,14 +581,6 @@ class Venv:
             cmd.append("-q")
         return run_subprocess(cmd)
 
-    def run_pip_get_exit_code(self, cmd: List[str]) -> ExitCode:
-        cmd = [str(self.python_path), "-m", "pip"] + cmd
-        if not self.verbose:
-            cmd.append("-q")
-        returncode = run_subprocess(
-            cmd, capture_stdout=False, capture_stderr=False
-        ).returncode
-        if returncode:
-            cmd_str = " ".join(str(c) for c in cmd)
-            logger.error(f"{cmd_str!r} failed")
-        return ExitCode(returncode)
+    def exec_pip(self, cmd: List[str]) -> NoReturn:
+        # pipx has nothing left to do, let pip take over the process
+        exec_app([str(self.python_path), "-m", "pip"] + cmd)
@@ -1,27 +1,43 @@
 import json
 import logging
+import os
 import textwrap
 from pathlib import Path
-from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from packaging.requirements import Requirement
 from packaging.utils import canonicalize_name
 
-try:
+if TYPE_CHECKING:
     from importlib import metadata
-except ImportError:
-    import importlib_metadata as metadata  # type: ignore
+
+    from packaging.requirements import Requirement
 
 from pipx.constants import WINDOWS
-from pipx.util import PipxError, run_subprocess
+from pipx.util import PipxError, interpreter_key, run_subprocess
 
 logger = logging.getLogger(__name__)
 
+VenvInfo = Tuple[List[str], Dict[str, str], str]
+PthFilesState = FrozenSet[Tuple[str, int, int]]
+
+# Results of fetch_info_in_venv, keyed by interpreter
+_venv_info_cache: Dict[Tuple[str, int, int, int], Tuple[PthFilesState, VenvInfo]] = {}
+
 
 class VenvInspectInformation(NamedTuple):
-    distributions: List[metadata.Distribution]
+    distributions: List["metadata.Distribution"]
     env: Dict[str, str]
     bin_path: Path
+    bin_names: Set[str]
 
 
 class VenvMetadata(NamedTuple):
@@ -34,8 +50,8 @@ class VenvMetadata(NamedTuple):
 
 
 def get_dist(
-    package: str, distributions: List[metadata.Distribution]
-) -> Optional[metadata.Distribution]:
+    package: str, distributions: List["metadata.Distribution"]
+) -> Optional["metadata.Distribution"]:
     """Find matching distribution in the canonicalized sense."""
     for dist in distributions:
         if canonicalize_name(dist.metadata["name"]) == canonicalize_name(package):
@@ -44,8 +60,10 @@ def get_dist(
 
 
 def get_package_dependencies(
-    dist: metadata.Distribution, extras: Set[str], env: Dict[str, str]
-) -> List[Requirement]:
+    dist: "metadata.Distribution", extras: Set[str], env: Dict[str, str]
+) -> List["Requirement"]:
+    from packaging.requirements import Requirement
+
     eval_env = env.copy()
     # Add an empty extra to enable evaluation of non-extra markers
     if not extras:
@@ -64,7 +82,21 @@ def get_package_dependencies(
     return dependencies
 
 
-def get_apps(dist: metadata.Distribution, bin_path: Path) -> List[str]:
+def _get_bin_names(bin_path: Path) -> Set[str]:
+    """Names of all entries in bin_path, read with a single directory scan
+
+    Names are normalized with os.path.normcase, so lookups must be too.
+    """
+    try:
+        with os.scandir(bin_path) as bin_entries:
+            return {os.path.normcase(entry.name) for entry in bin_entries}
+    except FileNotFoundError:
+        return set()
+
+
+def get_apps(
+    dist: "metadata.Distribution", bin_path: Path, bin_names: Set[str]
+) -> List[str]:
     apps = set()
 
     sections = {"console_scripts", "gui_scripts"}
@@ -72,9 +104,9 @@ def get_apps(dist: metadata.Distribution, bin_path: Path) -> List[str]:
     for ep in dist.entry_points:
         if ep.group not in sections:
             continue
-        if (bin_path / ep.name).exists():
+        if os.path.normcase(ep.name) in bin_names:
             apps.add(ep.name)
-        if WINDOWS and (bin_path / (ep.name + ".exe")).exists():
+        if WINDOWS and os.path.normcase(ep.name + ".exe") in bin_names:
             # WINDOWS adds .exe to entry_point name
             apps.add(ep.name + ".exe")
 
@@ -85,6 +117,9 @@ def get_apps(dist: metadata.Distribution, bin_path: Path) -> List[str]:
         #   (venv/bin or venv/Scripts is above distribution root)
         if Path(path).parts[0] != "..":
             continue
+        # cheap name check before touching the filesystem
+        if os.path.normcase(path.name) not in bin_names:
+            continue
 
         dist_file_path = Path(dist.locate_file(path))
         try:
@@ -97,6 +132,8 @@ def get_apps(dist: metadata.Distribution, bin_path: Path) -> List[str]:
     inst_files = dist.read_text("installed-files.txt") or ""
     for line in inst_files.splitlines():
         entry = line.split(",")[0]  # noqa: T484
+        if os.path.normcase(Path(entry).name) not in bin_names:
+            continue
         inst_file_path = Path(dist.locate_file(entry)).resolve()
         try:
             if inst_file_path.parent.samefile(bin_path):
@@ -108,8 +145,8 @@ def get_apps(dist: metadata.Distribution, bin_path: Path) -> List[str]:
 
 
 def _dfs_package_apps(
-    dist: metadata.Distribution,
-    package_req: Requirement,
+    dist: "metadata.Distribution",
+    package_req: "Requirement",
     venv_inspect_info: VenvInspectInformation,
     app_paths_of_dependencies: Dict[str, List[Path]],
     dep_visited: Optional[Dict[str, bool]] = None,
@@ -132,7 +169,9 @@ def _dfs_package_apps(
             raise PipxError(
                 "Pipx Internal Error: cannot find package {dep_req.name!r} metadata."
             )
-        app_names = get_apps(dep_dist, venv_inspect_info.bin_path)
+        app_names = get_apps(
+            dep_dist, venv_inspect_info.bin_path, venv_inspect_info.bin_names
+        )
         if app_names:
             app_paths_of_dependencies[dep_name] = [
                 venv_inspect_info.bin_path / app for app in app_names
@@ -145,67 +184,112 @@ def _dfs_package_apps(
     return app_paths_of_dependencies
 
 
-def _windows_extra_app_paths(app_paths: List[Path]) -> List[Path]:
+def _windows_extra_app_paths(app_paths: List[Path], bin_names: Set[str]) -> List[Path]:
     # In Windows, editable package have additional files starting with the
     #   same name that are required to be in the same dir to run the app
     # Add "*-script.py", "*.exe.manifest" only to app_paths to make
     #   execution work; do not add them to apps to ensure they are not listed
     app_paths_output = app_paths.copy()
     for app_path in app_paths:
-        win_app_path = app_path.parent / (app_path.stem + "-script.py")
-        if win_app_path.exists():
-            app_paths_output.append(win_app_path)
-        win_app_path = app_path.parent / (app_path.stem + ".exe.manifest")
-        if win_app_path.exists():
-            app_paths_output.append(win_app_path)
+        for extra_name in (
+            app_path.stem + "-script.py",
+            app_path.stem + ".exe.manifest",
+        ):
+            if os.path.normcase(extra_name) in bin_names:
+                app_paths_output.append(app_path.parent / extra_name)
     return app_paths_output
 
 
-def fetch_info_in_venv(venv_python_path: Path) -> Tuple[List[str], Dict[str, str], str]:
-    command_str = textwrap.dedent(
-        """
-        import json
-        import os
-        import platform
-        import sys
-
-        impl_ver = sys.implementation.version
-        implementation_version = "{0.major}.{0.minor}.{0.micro}".format(impl_ver)
-        if impl_ver.releaselevel != "final":
-            implementation_version += impl_ver.releaselevel[0] + impl_ver.serial
+def _get_pth_files_state(sys_path: List[str]) -> PthFilesState:
+    """Snapshot the .pth files that can extend sys.path of a venv
 
-        sys_path = sys.path
+    Installing packages can add or change these (e.g. editable installs), so
+    a cached sys.path is only reused while they are unchanged.
+    """
+    state = set()
+    for path_entry in sys_path:
         try:
-            sys_path.remove("")
-        except ValueError:
-            pass
-
-        print(
-            json.dumps(
-                {
-                    "sys_path": sys_path,
-                    "python_version": "{0.major}.{0.minor}.{0.micro}".format(sys.version_info),
-                    "environment": {
-                        "implementation_name": sys.implementation.name,
-                        "implementation_version": implementation_version,
-                        "os_name": os.name,
-                        "platform_machine": platform.machine(),
-                        "platform_release": platform.release(),
-                        "platform_system": platform.system(),
-                        "platform_version": platform.version(),
-                        "python_full_version": platform.python_version(),
-                        "platform_python_implementation": platform.python_implementation(),
-                        "python_version": ".".join(platform.python_version_tuple()[:2]),
-                        "sys_platform": sys.platform,
-                    },
-                }
-            )
+            with os.scandir(path_entry) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".pth"):
+                        entry_stat = entry.stat()
+                        state.add(
+                            (entry.path, entry_stat.st_mtime_ns, entry_stat.st_size)
+                        )
+        except OSError:
+            # e.g. zipped stdlib or a path that does not exist
+            continue
+    return frozenset(state)
+
+
+def fetch_info_in_venv(venv_python_path: Path) -> VenvInfo:
+    """Ask the venv python for its sys.path, marker environment and version
+
+    The answer is memoized so inspecting the same venv several times in one
+    pipx invocation (e.g. for every injected package) costs one interpreter
+    startup instead of one per inspection.
+    """
+    python_key = interpreter_key(venv_python_path)
+    cached = _venv_info_cache.get(python_key)
+    if cached is not None:
+        (pth_files_state, venv_info) = cached
+        if pth_files_state == _get_pth_files_state(venv_info[0]):
+            return venv_info
+
+    venv_info = _fetch_info_in_venv(venv_python_path)
+    _venv_info_cache[python_key] = (_get_pth_files_state(venv_info[0]), venv_info)
+    return venv_info
+
+
+# Run with the venv python to report what inspect_venv needs to evaluate
+#   the venv's distributions in-process; it never changes so build it once
+_FETCH_INFO_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import os
+    import platform
+    import sys
+
+    impl_ver = sys.implementation.version
+    implementation_version = "{0.major}.{0.minor}.{0.micro}".format(impl_ver)
+    if impl_ver.releaselevel != "final":
+        implementation_version += impl_ver.releaselevel[0] + impl_ver.serial
+
+    sys_path = sys.path
+    try:
+        sys_path.remove("")
+    except ValueError:
+        pass
+
+    print(
+        json.dumps(
+            {
+                "sys_path": sys_path,
+                "python_version": platform.python_version(),
+                "environment": {
+                    "implementation_name": sys.implementation.name,
+                    "implementation_version": implementation_version,
+                    "os_name": os.name,
+                    "platform_machine": platform.machine(),
+                    "platform_release": platform.release(),
+                    "platform_system": platform.system(),
+                    "platform_version": platform.version(),
+                    "python_full_version": platform.python_version(),
+                    "platform_python_implementation": platform.python_implementation(),
+                    "python_version": ".".join(platform.python_version_tuple()[:2]),
+                    "sys_platform": sys.platform,
+                },
+            }
         )
-        """
     )
+    """
+)
+
+
+def _fetch_info_in_venv(venv_python_path: Path) -> VenvInfo:
     venv_info = json.loads(
         run_subprocess(
-            [venv_python_path, "-c", command_str],
+            [venv_python_path, "-c", _FETCH_INFO_SCRIPT],
             capture_stderr=False,
             log_cmd_str="<fetch_info_in_venv commands>",
         ).stdout
@@ -226,6 +310,14 @@ def inspect_venv(
     app_paths_of_dependencies: Dict[str, List[Path]] = {}
     apps_of_dependencies: List[str] = []
 
+    # importlib.metadata and packaging.requirements are only needed for
+    #   inspection, so keep them off pipx's startup path
+    try:
+        from importlib import metadata
+    except ImportError:
+        import importlib_metadata as metadata  # type: ignore
+    from packaging.requirements import Requirement
+
     root_req = Requirement(root_package_name)
     root_req.extras = root_package_extras
 
@@ -235,6 +327,7 @@ def inspect_venv(
 
     venv_inspect_info = VenvInspectInformation(
         bin_path=venv_bin_path,
+        bin_names=_get_bin_names(venv_bin_path),
         env=venv_env,
         distributions=list(metadata.distributions(path=venv_sys_path)),
     )
@@ -248,10 +341,10 @@ def inspect_venv(
         root_dist, root_req, venv_inspect_info, app_paths_of_dependencies
     )
 
-    apps = get_apps(root_dist, venv_bin_path)
+    apps = get_apps(root_dist, venv_bin_path, venv_inspect_info.bin_names)
     app_paths = [venv_bin_path / app for app in apps]
     if WINDOWS:
-        app_paths = _windows_extra_app_paths(app_paths)
+        app_paths = _windows_extra_app_paths(app_paths, venv_inspect_info.bin_names)
 
     for dep in app_paths_of_dependencies:
         apps_of_dependencies += [
@@ -259,7 +352,7 @@ def inspect_venv(
         ]
         if WINDOWS:
             app_paths_of_dependencies[dep] = _windows_extra_app_paths(
-                app_paths_of_dependencies[dep]
+                app_paths_of_dependencies[dep], venv_inspect_info.bin_names
             )
 
     venv_metadata = VenvMetadata(
@@ -15,6 +15,13 @@ def pytest_addoption(parser):
         default=False,
         help="Run only the long, slow tests installing the maximum list of packages.",
     )
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        dest="run_network",
+        default=False,
+        help="Also run tests that need hosts other than the package index.",
+    )
 
 
 def pytest_configure(config):
@@ -25,6 +32,9 @@ def pytest_configure(config):
     else:
         new_markexpr = (f"{markexpr} and " if markexpr else "") + "not all_packages"
 
+    if not config.option.run_network:
+        new_markexpr = f"({new_markexpr}) and not network"
+
     config.option.markexpr = new_markexpr
 
 
@@ -33,6 +43,7 @@ def pipx_temp_env_helper(pipx_shared_dir, tmp_path, monkeypatch):
     bin_dir = Path(tmp_path) / "otherdir" / "pipxbindir"
 
     monkeypatch.setattr(constants, "PIPX_SHARED_LIBS", pipx_shared_dir)
+    monkeypatch.setattr(constants, "PIPX_SHARED_LIBS_CACHE_DIR", None)
     monkeypatch.setattr(shared_libs, "shared_libs", shared_libs._SharedLibs())
     monkeypatch.setattr(venv, "shared_libs", shared_libs.shared_libs)
 
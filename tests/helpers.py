@@ -1,6 +1,7 @@
 import json
 import os
 import re
+import subprocess
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -35,6 +36,12 @@ MOCK_PACKAGE_INFO_0_1: Dict[str, Any] = {
 }
 
 
+def execvpe_mock(cmd_path, cmd_args, env):
+    # os.spawnvpe() would call the mocked os.execvpe in its child process
+    return_code = subprocess.run(cmd_args, env=env).returncode
+    sys.exit(return_code)
+
+
 def app_name(app: str) -> str:
     return f"{app}.exe" if WIN else app
 
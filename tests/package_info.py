@@ -5,9 +5,7 @@ WIN = sys.platform.startswith("win")
 
 
 def _exe_if_win(apps):
-    app_strings = []
-    app_strings = [f"{app}.exe" if WIN else app for app in apps]
-    return app_strings
+    return [f"{app}.exe" for app in apps] if WIN else list(apps)
 
 
 # Versions of all packages possibly used in our tests
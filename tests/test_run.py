@@ -1,16 +1,25 @@
+import functools
+import http.server
+import importlib
 import logging
 import os
 import subprocess
 import sys
+import threading
+from pathlib import Path
 from unittest import mock
 
 import pytest  # type: ignore
 
 import pipx.main
 import pipx.util
-from helpers import run_pipx_cli
+from pipx import constants
+from helpers import execvpe_mock, run_pipx_cli
 from package_info import PKG
 
+# pipx.commands.run is shadowed by the run() function pipx.commands exports
+run_module = importlib.import_module("pipx.commands.run")
+
 
 def test_help_text(pipx_temp_env, monkeypatch, capsys):
     mock_exit = mock.Mock(side_effect=ValueError("raised in test to exit early"))
@@ -22,18 +31,6 @@ def test_help_text(pipx_temp_env, monkeypatch, capsys):
     assert "Download the latest version of a package" in captured.out
 
 
-def execvpe_mock(cmd_path, cmd_args, env):
-    return_code = subprocess.run(
-        [str(x) for x in cmd_args],
-        env=env,
-        stdout=None,
-        stderr=None,
-        encoding="utf-8",
-        universal_newlines=True,
-    ).returncode
-    sys.exit(return_code)
-
-
 def run_pipx_cli_exit(pipx_cmd_list, assert_exit=None):
     with pytest.raises(SystemExit) as sys_exit:
         run_pipx_cli(pipx_cmd_list)
@@ -42,11 +39,16 @@ def run_pipx_cli_exit(pipx_cmd_list, assert_exit=None):
         assert sys_exit.value.code == assert_exit
 
 
-@mock.patch("os.execvpe", new=execvpe_mock)
 def test_simple_run(pipx_temp_env, monkeypatch, capsys):
-    run_pipx_cli_exit(["run", "pycowsay", "--help"])
+    # Only where --help ends up matters here, so nothing is installed.
+    #   test_cache and test_package_determination run pycowsay for real.
+    download_and_run_mock = mock.Mock(side_effect=SystemExit(0))
+    monkeypatch.setattr(run_module, "_download_and_run", download_and_run_mock)
+    run_pipx_cli_exit(["run", "pycowsay", "--help"], assert_exit=0)
     captured = capsys.readouterr()
     assert "Download the latest version of a package" not in captured.out
+    (_, package_or_url, app, _, app_args, *_) = download_and_run_mock.call_args[0]
+    assert (package_or_url, app, app_args) == ("pycowsay", "pycowsay", ["--help"])
 
 
 @mock.patch("os.execvpe", new=execvpe_mock)
@@ -56,10 +58,63 @@ def test_cache(pipx_temp_env, monkeypatch, capsys, caplog):
     run_pipx_cli_exit(["run", "--verbose", "pycowsay", "cowsay", "args"], assert_exit=0)
     assert "Reusing cached venv" in caplog.text
 
+    # Only the removal matters, installing pycowsay again is skipped
+    download_and_run_mock = mock.Mock(side_effect=SystemExit(0))
+    monkeypatch.setattr(run_module, "_download_and_run", download_and_run_mock)
     run_pipx_cli_exit(["run", "--no-cache", "pycowsay", "cowsay", "args"])
     assert "Removing cached venv" in caplog.text
+    assert download_and_run_mock.called
 
 
+@mock.patch("os.execvpe", new=execvpe_mock)
+def test_cache_expired_venv_not_reused(pipx_temp_env, monkeypatch, capsys, caplog):
+    run_pipx_cli_exit(["run", "--no-cache", "pycowsay", "cowsay", "args"])
+    caplog.set_level(logging.DEBUG)
+    # The cache was just checked for expired venvs, but this one is still removed
+    run_pipx_cli_exit(["run", "--verbose", "pycowsay", "cowsay", "args"], assert_exit=0)
+    assert "Expired venvs were removed recently" in caplog.text
+    assert "Removing expired venv" in caplog.text
+    assert "Reusing cached venv" not in caplog.text
+
+
+class _ScriptRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b'print("Hello from a script served over HTTP")\n'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def served_script_url(monkeypatch):
+    """URL of a Python script served over HTTP from this machine"""
+    server = http.server.HTTPServer(("127.0.0.1", 0), _ScriptRequestHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    yield f"http://127.0.0.1:{server.server_address[1]}/pipx-demo.py"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "url_path", ["/pipx-demo.py", "/?pipx-demo.py", "/..?pipx-demo.py"]
+)
+@mock.patch("os.execvpe", new=execvpe_mock)
+def test_run_script_from_url(pipx_temp_env, capfd, served_script_url, url_path):
+    url = served_script_url.replace("/pipx-demo.py", url_path)
+    run_pipx_cli_exit(["run", url], assert_exit=0)
+    assert "Hello from a script served over HTTP" in capfd.readouterr().out
+    # Only the complete script is left, no partial download
+    script_paths = list(Path(constants.PIPX_VENV_CACHEDIR).glob("*/*"))
+    assert [script_path.suffix for script_path in script_paths] == [".py"]
+
+
+@pytest.mark.network
 @mock.patch("os.execvpe", new=execvpe_mock)
 def test_run_script_from_internet(pipx_temp_env, capsys):
     run_pipx_cli_exit(
@@ -73,6 +128,12 @@ def test_run_script_from_internet(pipx_temp_env, capsys):
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_command_parser():
+    # Parsing only fills in a new Namespace, so cases can share one parser
+    return pipx.main.get_command_parser()
+
+
 @pytest.mark.parametrize(
     "input_run_args,expected_app_with_args",
     [
@@ -91,10 +152,8 @@ def test_run_script_from_internet(pipx_temp_env, capsys):
         (["--", "--", "pycowsay", "--"], ["--", "pycowsay", "--"]),
     ],
 )
-def test_appargs_doubledash(
-    pipx_temp_env, capsys, monkeypatch, input_run_args, expected_app_with_args
-):
-    parser = pipx.main.get_command_parser()
+def test_appargs_doubledash(monkeypatch, input_run_args, expected_app_with_args):
+    parser = _cached_command_parser()
     monkeypatch.setattr(sys, "argv", ["pipx", "run"] + input_run_args)
     parsed_pipx_args = parser.parse_args()
     pipx.main.check_args(parsed_pipx_args)
@@ -105,7 +164,7 @@ def test_run_ensure_null_pythonpath():
     env = os.environ.copy()
     env["PYTHONPATH"] = "test"
     assert (
-        "None"
+        b"None"
         in subprocess.run(
             [
                 sys.executable,
@@ -116,10 +175,8 @@ def test_run_ensure_null_pythonpath():
                 "-c",
                 "import os; print(os.environ.get('PYTHONPATH'))",
             ],
-            universal_newlines=True,
             env=env,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
         ).stdout
     )
 
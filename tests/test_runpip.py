@@ -1,6 +1,13 @@
-from helpers import run_pipx_cli
+from unittest import mock
 
+import pytest  # type: ignore
 
+from helpers import execvpe_mock, run_pipx_cli
+
+
+@mock.patch("os.execvpe", new=execvpe_mock)
 def test_runpip(pipx_temp_env, monkeypatch, capsys):
     assert not run_pipx_cli(["install", "pycowsay"])
-    assert not run_pipx_cli(["runpip", "pycowsay", "list"])
+    with pytest.raises(SystemExit) as exit_info:
+        run_pipx_cli(["runpip", "pycowsay", "list"])
+    assert exit_info.value.code == 0
@@ -1,9 +1,13 @@
 import os
+import shutil
+import subprocess
+import sys
 import time
+from unittest import mock
 
 import pytest  # type: ignore
 
-from pipx import shared_libs
+from pipx import constants, shared_libs
 
 
 @pytest.mark.parametrize(
@@ -24,3 +28,111 @@ def test_auto_update_shared_libs(
     os.utime(shared_libs.shared_libs.pip_path, (access_time, mtime_minus_now + now))
 
     assert shared_libs.shared_libs.needs_upgrade is needs_upgrade
+
+
+def test_restore_shared_libs_from_archive(pipx_ultra_temp_env, monkeypatch, tmp_path):
+    monkeypatch.setattr(shared_libs.shared_libs, "cache_dir", tmp_path / "cache")
+    shared_libs.shared_libs.create(verbose=True)
+    assert shared_libs.shared_libs.archive_path.is_file()
+
+    shutil.rmtree(shared_libs.shared_libs.root)
+    assert not shared_libs.shared_libs.is_valid
+
+    def fail_run_subprocess(*args, **kwargs):
+        raise AssertionError("shared libs should be restored, not recreated")
+
+    monkeypatch.setattr(shared_libs, "run_subprocess", fail_run_subprocess)
+    shared_libs.shared_libs.create(verbose=True)
+    assert shared_libs.shared_libs.is_valid
+
+
+RESTORE_SHARED_LIBS_SCRIPT = """
+import sys
+from pipx import shared_libs
+
+def fail_run_subprocess(*args, **kwargs):
+    raise AssertionError("shared libs should be restored, not recreated")
+
+shared_libs.run_subprocess = fail_run_subprocess
+shared_libs.shared_libs.create(verbose=True)
+sys.exit(0 if shared_libs.shared_libs.is_valid else 1)
+"""
+
+
+def test_restore_shared_libs_from_archive_in_new_process(
+    pipx_ultra_temp_env, monkeypatch, tmp_path
+):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(shared_libs.shared_libs, "cache_dir", cache_dir)
+    shared_libs.shared_libs.create(verbose=True)
+    assert shared_libs.shared_libs.archive_path.is_file()
+
+    # As on a fresh machine: nothing of the shared libs left but the archive
+    shutil.rmtree(shared_libs.shared_libs.root)
+    env = {
+        **os.environ,
+        "PIPX_HOME": str(tmp_path / "freshpipxhome"),
+        "PIPX_SHARED_LIBS": str(shared_libs.shared_libs.root),
+        "PIPX_SHARED_LIBS_CACHE_DIR": str(cache_dir),
+    }
+    restore_process = subprocess.run(
+        [sys.executable, "-c", RESTORE_SHARED_LIBS_SCRIPT],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    assert restore_process.returncode == 0, restore_process.stdout
+    assert shared_libs.shared_libs.is_valid
+
+
+@pytest.mark.parametrize(
+    "mtime_minus_now,upgraded_recently",
+    [
+        (-shared_libs.SHARED_LIBS_MIN_UPGRADE_INTERVAL_SEC - 5 * 60, False),
+        (-shared_libs.SHARED_LIBS_MIN_UPGRADE_INTERVAL_SEC + 5 * 60, True),
+    ],
+)
+def test_skip_recent_shared_libs_upgrade(
+    pipx_ultra_temp_env, monkeypatch, tmp_path, mtime_minus_now, upgraded_recently
+):
+    now = time.time()
+    pip_path = tmp_path / "pip"
+    pip_path.touch()
+    os.utime(pip_path, (now, mtime_minus_now + now))
+    monkeypatch.setattr(shared_libs.shared_libs, "pip_path", pip_path)
+
+    assert shared_libs.shared_libs.upgraded_recently is upgraded_recently
+
+
+def _fake_valid_shared_libs(mtime_minus_now):
+    for path in (shared_libs.shared_libs.python_path, shared_libs.shared_libs.pip_path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    now = time.time()
+    os.utime(shared_libs.shared_libs.pip_path, (now, mtime_minus_now + now))
+
+
+def test_upgrade_skips_recently_upgraded_shared_libs(pipx_ultra_temp_env, monkeypatch):
+    run_subprocess = mock.Mock(return_value=subprocess.CompletedProcess([], 0, "", ""))
+    monkeypatch.setattr(shared_libs, "run_subprocess", run_subprocess)
+
+    _fake_valid_shared_libs(-60)
+    shared_libs.shared_libs.upgrade()
+    assert run_subprocess.call_count == 0
+
+    _fake_valid_shared_libs(-shared_libs.SHARED_LIBS_MIN_UPGRADE_INTERVAL_SEC - 60)
+    shared_libs.shared_libs.upgrade()
+    assert run_subprocess.call_count == 1
+
+
+def test_upgrade_recently_upgraded_shared_libs_when_forced(
+    pipx_ultra_temp_env, monkeypatch
+):
+    run_subprocess = mock.Mock(return_value=subprocess.CompletedProcess([], 0, "", ""))
+    monkeypatch.setattr(shared_libs, "run_subprocess", run_subprocess)
+    monkeypatch.setattr(constants, "PIPX_FORCE_SHARED_LIBS_UPGRADE", True)
+
+    _fake_valid_shared_libs(-60)
+    shared_libs.shared_libs.upgrade()
+    assert run_subprocess.call_count == 1
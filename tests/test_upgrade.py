@@ -1,6 +1,15 @@
+import importlib
+
 import pytest  # type: ignore
 
 from helpers import mock_legacy_venv, run_pipx_cli
+from pipx import constants
+from pipx.pipx_metadata_file import PackageInfo, PipxMetadata
+from pipx.util import PipxError
+from pipx.venv import Venv
+
+# pipx.commands.upgrade is shadowed by the upgrade() function pipx.commands exports
+upgrade_module = importlib.import_module("pipx.commands.upgrade")
 
 
 def test_upgrade(pipx_temp_env, capsys):
@@ -75,3 +84,72 @@ def test_upgrade_no_include_injected(pipx_temp_env, capsys):
     captured = capsys.readouterr()
     assert "upgraded package pylint" in captured.out
     assert "upgraded package black" not in captured.out
+
+
+def _package_info(package_name, include_apps):
+    return PackageInfo(
+        package=package_name,
+        package_or_url=package_name,
+        pip_args=[],
+        include_dependencies=False,
+        include_apps=include_apps,
+        apps=[],
+        app_paths=[],
+        apps_of_dependencies=[],
+        app_paths_of_dependencies={},
+        package_version="1.0",
+    )
+
+
+def test_upgrade_failing_injected_package_spares_others(pipx_temp_env, monkeypatch):
+    venv_dir = constants.PIPX_LOCAL_VENVS / "pycowsay"
+    venv_dir.mkdir(parents=True)
+    metadata = PipxMetadata(venv_dir, read=False)
+    metadata.main_package = _package_info("pycowsay", include_apps=True)
+    metadata.injected_packages = {
+        package_name: _package_info(package_name, include_apps=False)
+        for package_name in ["black", "yanked"]
+    }
+    metadata.python_version = "Python 3.x"
+    metadata.venv_args = []
+    metadata.write()
+
+    pip_runs = []
+
+    def upgrade_packages(self, package_specs, pip_args, raise_error=True, **kwargs):
+        pip_runs.append(list(package_specs))
+        if "yanked" not in package_specs:
+            return True
+        if raise_error:
+            raise PipxError("'pip install --upgrade yanked' failed")
+        return False
+
+    finished = []
+
+    def finish_package_upgrade(venv, package_name, *args, **kwargs):
+        finished.append(package_name)
+        return 1
+
+    monkeypatch.setattr(Venv, "upgrade_packages", upgrade_packages)
+    monkeypatch.setattr(
+        upgrade_module, "_finish_package_upgrade", finish_package_upgrade
+    )
+
+    with pytest.raises(PipxError, match="yanked"):
+        upgrade_module._upgrade_venv(
+            venv_dir,
+            [],
+            verbose=False,
+            include_injected=True,
+            upgrading_all=True,
+            force=False,
+        )
+
+    # Together first, then one at a time
+    assert pip_runs == [
+        ["pycowsay", "black", "yanked"],
+        ["pycowsay"],
+        ["black"],
+        ["yanked"],
+    ]
+    assert finished == ["pycowsay", "black"]
@@ -0,0 +1,63 @@
+import os
+import shutil
+import sys
+
+import pytest  # type: ignore
+
+from pipx import util
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="creating symlinks needs privileges"
+)
+def test_rmdir_symlinked_root_keeps_target(tmp_path):
+    target = tmp_path / "target"
+    for i in range(20):
+        (target / f"sub{i}" / "x").mkdir(parents=True)
+        (target / f"sub{i}" / "x" / "file").write_text("data")
+    link = tmp_path / "link"
+    link.symlink_to(target, target_is_directory=True)
+
+    with pytest.raises(OSError):
+        util.rmdir(link)
+
+    for i in range(20):
+        assert (target / f"sub{i}" / "x" / "file").read_text() == "data"
+
+
+def test_rmdir_removes_tree(tmp_path):
+    root = tmp_path / "root"
+    for i in range(20):
+        (root / f"sub{i}" / "x").mkdir(parents=True)
+        (root / f"sub{i}" / "x" / "file").write_text("data")
+
+    util.rmdir(root)
+
+    assert not root.exists()
+
+
+@pytest.mark.parametrize("scandir_error", [FileNotFoundError, PermissionError])
+def test_rmdir_subtree_fails_to_list(tmp_path, monkeypatch, scandir_error):
+    # Few top-level dirs, so expansion has to list each of them
+    root = tmp_path / "root"
+    for i in range(4):
+        (root / f"sub{i}" / "x" / "y").mkdir(parents=True)
+        (root / f"sub{i}" / "x" / "y" / "file").write_text("data")
+    failing_subtree = str(root / "sub2")
+    real_scandir = os.scandir
+    failed = []
+
+    def scandir(path="."):
+        if path == failing_subtree and not failed:
+            failed.append(path)
+            if scandir_error is FileNotFoundError:
+                # as if removed by someone else meanwhile
+                shutil.rmtree(failing_subtree)
+            raise scandir_error(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    util.rmdir(root)
+
+    assert failed
+    assert not root.exists()
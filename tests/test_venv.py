@@ -0,0 +1,79 @@
+import subprocess
+import sys
+from unittest import mock
+
+import pytest  # type: ignore
+
+import pipx.constants
+from pipx import venv
+from pipx.pipx_metadata_file import PackageInfo
+from pipx.util import PipxError
+
+
+@pytest.mark.parametrize(
+    "env_var, in_process",
+    [
+        (None, True),
+        ("__PYVENV_LAUNCHER__", False),
+        ("PYTHONPATH", False),
+    ],
+)
+def test_create_venv_in_process_only_without_blocklisted_env(
+    pipx_temp_env, tmp_path, monkeypatch, env_var, in_process
+):
+    # Subprocesses get these variables removed, the in-process venv module
+    #   would see them
+    monkeypatch.delenv("__PYVENV_LAUNCHER__", raising=False)
+    monkeypatch.delenv("PYTHONPATH", raising=False)
+    if env_var is not None:
+        monkeypatch.setenv(env_var, sys.executable)
+    run_in_process_mock = mock.Mock(wraps=venv._run_venv_module_in_process)
+    monkeypatch.setattr(venv, "_run_venv_module_in_process", run_in_process_mock)
+
+    test_venv = venv.Venv(tmp_path / "testvenv", python=sys.executable)
+    test_venv.create_venv(venv_args=[], pip_args=[])
+
+    assert run_in_process_mock.called is in_process
+    assert test_venv.python_path.exists()
+
+
+def _injected_package_info(package_name):
+    return PackageInfo(
+        package=package_name,
+        package_or_url=package_name,
+        pip_args=[],
+        include_dependencies=False,
+        include_apps=False,
+        apps=[],
+        app_paths=[],
+        apps_of_dependencies=[],
+        app_paths_of_dependencies={},
+        package_version="1.0",
+    )
+
+
+def test_install_injected_packages_names_failing_package(
+    pipx_temp_env, tmp_path, monkeypatch
+):
+    def run_subprocess(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, int("bad-pkg" in cmd), "", "")
+
+    run_subprocess_mock = mock.Mock(side_effect=run_subprocess)
+    monkeypatch.setattr(venv, "run_subprocess", run_subprocess_mock)
+    monkeypatch.setattr(pipx.constants, "pipx_log_file", tmp_path / "pipx.log")
+
+    test_venv = venv.Venv(tmp_path / "testvenv")
+    with pytest.raises(PipxError, match=r"^Error installing bad-pkg\.$"):
+        test_venv.install_injected_packages(
+            {
+                package_name: _injected_package_info(package_name)
+                for package_name in ["good-pkg", "bad-pkg"]
+            }
+        )
+
+    # Together first, then one at a time to find the one that failed
+    assert [call.args[0][-2:] for call in run_subprocess_mock.call_args_list] == [
+        ["good-pkg", "bad-pkg"],
+        ["install", "good-pkg"],
+        ["install", "bad-pkg"],
+    ]